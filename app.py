@@ -9,28 +9,77 @@ import sys
 # Set tokenizers parallelism to avoid multiprocessing issues
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
-from flask import Flask, jsonify, request, send_from_directory, send_file
-from models.database import get_db_session
-from models.database import Simulation, DailyRecap, NewsSentiment, News, RealtimePrediction
-from sqlalchemy import desc, asc, func, cast, Date, and_
+from flask import Flask, Response, jsonify, request, send_from_directory, send_file
+from flask.json.provider import JSONProvider
+from werkzeug.utils import safe_join
+from models.database import get_request_session, remove_request_session, init_database
+from models.database import Simulation, DailyRecap, NewsSentiment, News, RealtimePrediction, SimulationSummary
+from models.simulation_summary import compute_simulation_returns
+from cache import cached_value, invalidate
+from jobs import submit_job, get_job
+from sqlalchemy import desc, asc, func, cast, Date, Text, and_, case, select
 from datetime import datetime, timedelta
-import json
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
+from functools import wraps
+import hashlib
 import logging
+import orjson
 from sqlalchemy.orm import aliased
+import threading
 import time
-from realtime.news_aggregator import RealtimeNewsAggregator
+from realtime.news_aggregator import RealtimeNewsAggregator, get_news_time_range
 from realtime.realtime_predictor import RealtimeTradingPredictor
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='frontend/build/static', template_folder='frontend/build')
+# When deployed behind a server that honours X-Sendfile, hand static file bodies to it
+# instead of streaming them through Python
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
+# Files under the static folder are content-hashed by the React build, so browsers may
+# cache them for a year; index.html is always sent with max_age=0 so new builds are picked up
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(os.getenv('STATIC_MAX_AGE', 31536000))
+
+def dump_json(obj):
+    """Encode obj as JSON bytes with orjson (datetimes and dates come out in ISO 8601, so
+    views pass them through rather than calling isoformat() per row)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+def raw_json(expression, default):
+    """Select a JSON value as its serialized text (default when missing or null) instead of decoding it"""
+    return func.coalesce(func.nullif(cast(expression, Text), 'null'), default)
+
+def ojsonify(obj):
+    """Serialize a large payload with orjson and return it as a JSON response"""
+    return Response(dump_json(obj), mimetype='application/json')
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json() use it too"""
+    
+    def dumps(self, obj, **kwargs):
+        return dump_json(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Write the encoded bytes straight into the response, skipping the str round-trip
+        return ojsonify(self._prepare_response_obj(args, kwargs))
+
+app.json = OrjsonProvider(app)
+
+@app.teardown_appcontext
+def release_db_session(exception=None):
+    """Release the request's database session at the end of every request"""
+    remove_request_session()
 
 # Serve React App
 @app.route('/')
 def serve():
     """Serve the React app"""
-    return send_from_directory(app.template_folder, 'index.html')
+    return send_from_directory(app.template_folder, 'index.html', max_age=0)
 
 # Vector Search Endpoints (must be before catch-all route)
 @app.route('/api/vector/search', methods=['POST'])
@@ -65,7 +114,7 @@ def vector_search_endpoint():
                 'id': news_record.id,
                 'title': news_record.title,
                 'description': news_record.description,
-                'date_publish': news_record.date_publish.isoformat(),
+                'date_publish': news_record.date_publish,
                 'ticker_metadata': news_record.ticker_metadata,
                 'similarity_score': similarity
             })
@@ -115,7 +164,7 @@ def search_by_ticker_endpoint(ticker):
                 'id': news_record.id,
                 'title': news_record.title,
                 'description': news_record.description,
-                'date_publish': news_record.date_publish.isoformat(),
+                'date_publish': news_record.date_publish,
                 'ticker_metadata': news_record.ticker_metadata,
                 'price_change_pct': price_change
             })
@@ -179,7 +228,7 @@ def recent_news_endpoint():
                 'id': news_record.id,
                 'title': news_record.title,
                 'description': news_record.description,
-                'date_publish': news_record.date_publish.isoformat(),
+                'date_publish': news_record.date_publish,
                 'ticker_metadata': news_record.ticker_metadata
             })
         
@@ -204,7 +253,7 @@ def get_similar_articles_for_sentiment(sentiment_id):
         from models.vector_db import vector_search
         from models.database import NewsSentiment, NewsFaiss
         
-        session = get_db_session()
+        session = get_request_session()
         
         # Get the sentiment record
         sentiment_record = session.query(NewsSentiment).filter(
@@ -227,27 +276,32 @@ def get_similar_articles_for_sentiment(sentiment_id):
                 'total_found': 0
             })
         
-        # Fetch the actual NewsFaiss records
-        similar_articles = []
+        # Handle both [id, score] and just id formats for backwards compatibility
+        similar_pairs = []
         for faiss_data in similar_faiss_data:
-            # Handle both [id, score] and just id formats for backwards compatibility
             if isinstance(faiss_data, list) and len(faiss_data) == 2:
-                faiss_id, similarity_score = faiss_data
+                similar_pairs.append((faiss_data[0], faiss_data[1]))
             else:
-                faiss_id = faiss_data
-                similarity_score = None
-            
-            # Get the NewsFaiss record
-            news_faiss = session.query(NewsFaiss).filter(
-                NewsFaiss.id == faiss_id
-            ).first()
+                similar_pairs.append((faiss_data, None))
+        
+        # Fetch all the NewsFaiss records in one query, then keep the stored similarity order
+        news_faiss_by_id = {
+            news_faiss.id: news_faiss
+            for news_faiss in session.query(NewsFaiss).filter(
+                NewsFaiss.id.in_([faiss_id for faiss_id, _ in similar_pairs])
+            )
+        }
+        
+        similar_articles = []
+        for faiss_id, similarity_score in similar_pairs:
+            news_faiss = news_faiss_by_id.get(faiss_id)
             
             if news_faiss:
                 article_data = {
                     'id': news_faiss.id,
                     'title': news_faiss.title,
                     'description': news_faiss.description,
-                    'date_publish': news_faiss.date_publish.isoformat(),
+                    'date_publish': news_faiss.date_publish,
                     'ticker_metadata': news_faiss.ticker_metadata,
                 }
                 
@@ -280,124 +334,296 @@ def serve_static(path):
         # API routes should not be handled here
         return jsonify({'error': 'API endpoint not found'}), 404
     
-    # Try to serve static files first
-    try:
+    # Serve static files that exist; anything else is a client-side route of the React app
+    static_path = safe_join(app.static_folder, path)
+    if static_path and os.path.isfile(static_path):
         return send_from_directory(app.static_folder, path)
-    except:
-        # If file not found, serve the React app (for client-side routing)
-        return send_from_directory(app.template_folder, 'index.html')
+    return send_from_directory(app.template_folder, 'index.html', max_age=0)
+
+# Cached response bodies of polled list endpoints: cache key -> (signature, expires_at, etag, body),
+# least recently used first. Keys include page arguments, so the cache is bounded.
+_signature_cache = OrderedDict()
+_signature_cache_lock = threading.Lock()
+SIGNATURE_CACHE_SIZE = 256
+
+def signature_cached_response(key, signature, ttl, build):
+    """Serve build()'s JSON from the in-process cache while signature is unchanged (at most ttl seconds)
+    
+    signature is a cheap fingerprint of the data behind the response; the body is serialized
+    once per change and sent with an ETag, so matching If-None-Match requests get a 304.
+    """
+    with _signature_cache_lock:
+        entry = _signature_cache.get(key)
+        if entry is not None:
+            _signature_cache.move_to_end(key)
+    now = time.time()
+    if entry is None or entry[0] != signature or now >= entry[1]:
+        body = ojsonify(build()).get_data()
+        entry = (signature, now + ttl, hashlib.sha1(body).hexdigest(), body)
+        with _signature_cache_lock:
+            _signature_cache[key] = entry
+            _signature_cache.move_to_end(key)
+            while len(_signature_cache) > SIGNATURE_CACHE_SIZE:
+                _signature_cache.popitem(last=False)
+    
+    response = app.response_class(entry[3], mimetype='application/json')
+    response.set_etag(entry[2])
+    # Let browsers keep the body but revalidate it with If-None-Match on every load
+    response.cache_control.no_cache = True
+    # Answers a matching If-None-Match with 304 Not Modified
+    return response.make_conditional(request)
+
+def drop_signature_cache(*names):
+    """Drop this process's cached responses named names (keys are a name or a tuple starting with one)"""
+    with _signature_cache_lock:
+        for key in [k for k in _signature_cache if (k[0] if isinstance(k, tuple) else k) in names]:
+            del _signature_cache[key]
+
+def invalidate_realtime():
+    """Drop cached realtime responses after stored news or predictions changed
+    
+    Besides the cache.py group, this clears the signature-cached prediction lists, whose
+    fingerprint does not see a prediction updated in place.
+    """
+    invalidate('realtime')
+    drop_signature_cache('latest-prediction', 'recent-predictions')
+
+# Largest page_size the list endpoints accept
+MAX_PAGE_SIZE = 100
+
+def page_arguments(default_page_size):
+    """Read ?page / ?page_size, clamped to page >= 1 and 1 <= page_size <= MAX_PAGE_SIZE"""
+    page = max(request.args.get('page', 1, type=int), 1)
+    page_size = min(max(request.args.get('page_size', default_page_size, type=int), 1), MAX_PAGE_SIZE)
+    return page, page_size
+
+# /api/simulations is rebuilt when the simulation fingerprint changes, and at least every
+# SIMULATIONS_CACHE_TTL seconds because final metrics are written into simulation.extra_data
+# in place when a run completes.
+SIMULATIONS_CACHE_TTL = 30
+
+def listed_simulation():
+    """Filter for simulations shown by /api/simulations: those with at least one daily recap"""
+    return select(DailyRecap.id).where(DailyRecap.simulation_id == Simulation.id).exists()
+
+def build_simulations_list(session, limit=None, offset=0):
+    """Build the /api/simulations payload: simulations (newest first, optionally one window of
+    them) with their return series"""
+    # Get the simulations. Metrics come from their summary columns, so the extra_data
+    # document is never loaded or decoded.
+    simulations = session.execute(
+        select(
+            Simulation.id,
+            Simulation.executed_at,
+            func.coalesce(Simulation.total_trades, 0).label('total_trades'),
+            func.coalesce(Simulation.sharpe_ratio, 0).label('sharpe_ratio'),
+            func.coalesce(Simulation.max_drawdown_pct, 0).label('max_drawdown'),
+            func.coalesce(Simulation.win_rate_pct, 0).label('win_rate')
+        ).where(listed_simulation())
+        .order_by(desc(Simulation.executed_at), desc(Simulation.id)).limit(limit).offset(offset)
+    ).all()
+    
+    # Return series of completed simulations are precomputed in simulation_summary
+    summaries = select(
+        SimulationSummary.simulation_id, SimulationSummary.dates, SimulationSummary.daily_returns,
+        SimulationSummary.cumulative_returns, SimulationSummary.final_return
+    )
+    if limit is not None:
+        summaries = summaries.where(SimulationSummary.simulation_id.in_([sim.id for sim in simulations]))
+    returns = {
+        summary.simulation_id: {
+            'dates': summary.dates,
+            'daily_returns': summary.daily_returns,
+            'cumulative_returns': summary.cumulative_returns,
+            'final_return': summary.final_return
+        }
+        for summary in session.execute(summaries)
+    }
+    
+    # Compute the rest (running simulations, or ones completed before summaries existed;
+    # migrate_database.py stores summaries for the latter)
+    missing_ids = [sim.id for sim in simulations if sim.id not in returns]
+    if missing_ids:
+        returns.update(compute_simulation_returns(session, missing_ids))
+    
+    result = []
+    for sim in simulations:
+        if sim.id in returns:
+            series = returns[sim.id]
+            
+            sim_data = {
+                'id': sim.id,
+                'executed_at': sim.executed_at,
+                'dates': series['dates'],
+                'daily_returns': series['daily_returns'],
+                'cumulative_returns': series['cumulative_returns'],
+                'final_return': series['final_return'],
+                'total_trades': sim.total_trades,
+                'sharpe_ratio': sim.sharpe_ratio,
+                'max_drawdown': sim.max_drawdown,
+                'win_rate': sim.win_rate
+            }
+            
+            result.append(sim_data)
+    
+    return result
 
 @app.route('/api/simulations')
 def get_simulations():
     """Get all simulations with their performance data"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Get all simulations with their daily performance
-        simulations = session.query(Simulation).order_by(desc(Simulation.executed_at)).all()
-        
-        result = []
-        for sim in simulations:
-            # Get daily recap data for this simulation
-            daily_data = session.query(DailyRecap).filter_by(simulation_id=sim.id).order_by(asc(DailyRecap.date)).all()
-            
-            if daily_data:
-                # Calculate daily returns
-                daily_returns = []
-                dates = []
-                
-                for day in daily_data:
-                    dates.append(day.date.strftime('%Y-%m-%d'))
-                    # Calculate return percentage from starting money
-                    if day.starting_money > 0:
-                        daily_return = ((day.ending_money - day.starting_money) / day.starting_money) * 100
-                    else:
-                        daily_return = 0
-                    daily_returns.append(round(daily_return, 2))
-                
-                # Calculate cumulative returns
-                cumulative_returns = []
-                initial_value = daily_data[0].starting_money
-                for day in daily_data:
-                    cumulative_return = ((day.ending_money - initial_value) / initial_value) * 100
-                    cumulative_returns.append(round(cumulative_return, 2))
-                
-                # Get simulation metadata
-                extra_data = sim.extra_data or {}
-                metrics = extra_data.get('metrics', {})
-                
-                sim_data = {
-                    'id': sim.id,
-                    'executed_at': sim.executed_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    'dates': dates,
-                    'daily_returns': daily_returns,
-                    'cumulative_returns': cumulative_returns,
-                    'final_return': cumulative_returns[-1] if cumulative_returns else 0,
-                    'total_trades': extra_data.get('total_trades', 0),
-                    'sharpe_ratio': metrics.get('sharpe_ratio', 0),
-                    'max_drawdown': metrics.get('max_drawdown_pct', 0),
-                    'win_rate': metrics.get('win_rate_pct', 0)
-                }
-                
-                result.append(sim_data)
+        # Cheap fingerprint of the data behind the listing; the count (also the paged
+        # 'total') covers exactly the simulations the listing shows
+        signature = tuple(session.query(
+            func.max(Simulation.executed_at),
+            func.count(Simulation.id),
+            select(func.max(DailyRecap.id)).scalar_subquery()
+        ).filter(listed_simulation()).one())
+        
+        # Optional paging: ?page=N&page_size=M returns one window of simulations as
+        # {'items', 'page', 'page_size', 'has_more'} (plus 'total' with include_total=1);
+        # without it the full list is returned as before
+        if 'page' not in request.args and 'page_size' not in request.args:
+            return signature_cached_response('simulations', signature, SIMULATIONS_CACHE_TTL,
+                                             lambda: build_simulations_list(session))
+        
+        page, page_size = page_arguments(default_page_size=25)
+        include_total = request.args.get('include_total', '0').lower() in ('1', 'true')
+        
+        def build_page():
+            # One extra row tells whether another page follows
+            items = build_simulations_list(session, limit=page_size + 1, offset=(page - 1) * page_size)
+            result = {
+                'items': items[:page_size],
+                'page': page,
+                'page_size': page_size,
+                'has_more': len(items) > page_size
+            }
+            if include_total:
+                result['total'] = signature[1]
+            return result
         
-        return jsonify(result)
+        # Keyed by the validated arguments only, so unknown or reordered parameters share an entry
+        return signature_cached_response(('simulations', page, page_size, include_total), signature,
+                                         SIMULATIONS_CACHE_TTL, build_page)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
         session.close()
 
+# Size of the chunks streamed JSON responses are flushed in
+STREAM_CHUNK_BYTES = 64 * 1024
+
 @app.route('/api/simulation/<int:simulation_id>')
 def get_simulation_details(simulation_id):
     """Get detailed daily data for a specific simulation"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Get simulation info
-        simulation = session.query(Simulation).filter_by(id=simulation_id).first()
+        # Read-only view: Core selects return plain rows, skipping ORM instance
+        # construction and identity-map bookkeeping (SQLAlchemy caches the compiled SQL)
+        # The JSON blobs are read as their stored text and spliced into the response as
+        # orjson fragments, since the server never looks inside them
+        simulation = session.execute(
+            select(Simulation.id, Simulation.executed_at,
+                   raw_json(Simulation.extra_data, '{}').label('extra_data'),
+                   Simulation.extra_data['completed_at'].as_string().label('completed_at'),
+                   Simulation.total_trades, Simulation.sharpe_ratio,
+                   select(func.count(DailyRecap.id))
+                   .where(DailyRecap.simulation_id == Simulation.id)
+                   .scalar_subquery().label('recap_count'),
+                   select(func.max(DailyRecap.id))
+                   .where(DailyRecap.simulation_id == Simulation.id)
+                   .scalar_subquery().label('max_recap_id'))
+            .where(Simulation.id == simulation_id)
+        ).first()
         if not simulation:
             return jsonify({'error': 'Simulation not found'}), 404
         
-        # Get daily recap data
-        daily_data = session.query(DailyRecap).filter_by(simulation_id=simulation_id).order_by(asc(DailyRecap.date)).all()
+        # The per-day trades/positions lists are only sent with ?include_trades=true; by
+        # default the (large) extra_data column is not read at all, since the list view
+        # only needs the stored counts. /day/<date> serves the full detail for one day.
+        include_trades = request.args.get('include_trades', 'false').lower() == 'true'
+        
+        # A completed simulation no longer changes, so its fingerprint is the ETag and a
+        # revalidating client gets a 304 before any daily data is read. Running simulations
+        # get no ETag, since their daily recaps are also updated in place (closing trades).
+        etag = None
+        if simulation.completed_at:
+            etag = hashlib.sha1(repr((
+                simulation_id, simulation.executed_at, simulation.completed_at, simulation.total_trades,
+                simulation.sharpe_ratio, simulation.recap_count, simulation.max_recap_id, include_trades
+            )).encode()).hexdigest()
+        if etag and etag in request.if_none_match:
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        columns = [DailyRecap.date, DailyRecap.starting_money, DailyRecap.ending_money,
+                   DailyRecap.daily_pnl.label('daily_pnl'), DailyRecap.daily_return.label('daily_return'),
+                   DailyRecap.num_long_positions, DailyRecap.num_short_positions, DailyRecap.total_trades]
+        if include_trades:
+            columns += [raw_json(DailyRecap.extra_data['trades'], '[]').label('trades'),
+                        raw_json(DailyRecap.extra_data['positions'], '[]').label('positions')]
+        
+        # Get daily recap data before the response starts, so a database error is still
+        # answered with a 500 rather than a 200 with truncated JSON
+        daily_rows = session.execute(
+            select(*columns)
+            .where(DailyRecap.simulation_id == simulation_id)
+            .order_by(asc(DailyRecap.date))
+        ).all()
         
-        result = {
-            'simulation': {
-                'id': simulation.id,
-                'executed_at': simulation.executed_at.strftime('%Y-%m-%d %H:%M:%S'),
-                'extra_data': simulation.extra_data or {}
-            },
-            'daily_data': []
+        simulation_data = {
+            'id': simulation.id,
+            'executed_at': simulation.executed_at,
+            'extra_data': orjson.Fragment(simulation.extra_data)
         }
         
-        for day in daily_data:
-            extra_data = day.extra_data or {}
-            
-            # Parse trading data from extra_data
-            trades = extra_data.get('trades', [])
-            positions = extra_data.get('positions', [])
-            
-            # Count net positions at end of day, not individual trades
-            num_long_positions = len([p for p in positions if p.get('position_type') == 'long'])
-            num_short_positions = len([p for p in positions if p.get('position_type') == 'short'])
+        def generate():
+            # Only serialization happens while streaming, one day at a time, so the encoded
+            # response is never held in memory as a whole
+            yield b'{"simulation":' + dump_json(simulation_data) + b',"daily_data":['
             
-            day_data = {
-                'date': day.date.strftime('%Y-%m-%d'),
-                'starting_money': round(day.starting_money, 2),
-                'ending_money': round(day.ending_money, 2),
-                'daily_pnl': round(day.ending_money - day.starting_money, 2),
-                'daily_return': round(((day.ending_money - day.starting_money) / day.starting_money) * 100, 2) if day.starting_money > 0 else 0,
-                'trades': trades,
-                'positions': positions,
-                'num_long_positions': num_long_positions,
-                'num_short_positions': num_short_positions,
-                'total_trades': len(trades)
-            }
+            # Days are written out in ~64 KB chunks rather than one tiny write per day.
+            # Globals used per row are bound to locals once.
+            _round, _dump, _fragment = round, dump_json, orjson.Fragment
+            chunk = []
+            chunk_size = 0
+            for i, day in enumerate(daily_rows):
+                day_data = {
+                    'date': day.date,
+                    'starting_money': _round(day.starting_money, 2),
+                    'ending_money': _round(day.ending_money, 2),
+                    'daily_pnl': _round(day.daily_pnl, 2),
+                    'daily_return': _round(day.daily_return, 2),
+                    'num_long_positions': day.num_long_positions or 0,
+                    'num_short_positions': day.num_short_positions or 0,
+                    'total_trades': day.total_trades or 0
+                }
+                
+                if include_trades:
+                    day_data['trades'] = _fragment(day.trades)
+                    day_data['positions'] = _fragment(day.positions)
+                
+                encoded = (b',' if i else b'') + _dump(day_data)
+                chunk.append(encoded)
+                chunk_size += len(encoded)
+                if chunk_size >= STREAM_CHUNK_BYTES:
+                    yield b''.join(chunk)
+                    chunk = []
+                    chunk_size = 0
             
-            result['daily_data'].append(day_data)
+            yield b''.join(chunk) + b']}'
         
-        return jsonify(result)
+        response = Response(generate(), mimetype='application/json')
+        if etag:
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -407,7 +633,7 @@ def get_simulation_details(simulation_id):
 @app.route('/api/simulation/<int:simulation_id>/day/<date>')
 def get_day_details(simulation_id, date):
     """Get detailed news and sentiment data for a specific day"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
         # Parse the date
@@ -416,43 +642,35 @@ def get_day_details(simulation_id, date):
         except ValueError:
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
         
-        # Get all news for this day with optional sentiment analysis
-        # Use date() function to extract date part from timestamp
-        all_news_query = session.query(News).filter(
-            func.date(News.time_published) == day_date
-        ).order_by(News.time_published)
-        
-        all_news = all_news_query.all()
-        
-        # If no news found, try a broader date range (sometimes timezone issues)
-        if not all_news:
-            start_datetime = datetime.combine(day_date, datetime.min.time())
-            end_datetime = datetime.combine(day_date + timedelta(days=1), datetime.min.time())
-            
-            all_news_query = session.query(News).filter(
-                News.time_published >= start_datetime,
-                News.time_published < end_datetime
-            ).order_by(News.time_published)
-            
-            all_news = all_news_query.all()
-        
-        # Get sentiment data for this simulation and date
-        sentiment_data = {}
-        sentiment_records = session.query(NewsSentiment).filter(
+        # Get all news for this day with optional sentiment analysis.
+        # Filter on a half-open range of the raw timestamp (rather than date(time_published))
+        # so the time_published index can be used.
+        start_datetime = datetime.combine(day_date, datetime.min.time())
+        end_datetime = start_datetime + timedelta(days=1)
+        
+        # LEFT JOIN this simulation's sentiment records for the day so news and their
+        # (possibly several, or no) sentiments arrive in one query, grouped by news id
+        news_rows = session.query(
+            News.id, News.title, News.summary, News.source, News.url, News.time_published,
+            NewsSentiment.id.label('sentiment_id'), NewsSentiment.ticker, NewsSentiment.sentiment,
+            NewsSentiment.extra_data, NewsSentiment.similar_news_faiss_ids
+        ).outerjoin(NewsSentiment, and_(
+            NewsSentiment.headline_id == News.id,
             NewsSentiment.simulation_id == simulation_id,
             NewsSentiment.date == day_date
-        ).all()
-        
-        # Create a mapping of headline_id to list of sentiment data
-        for sentiment in sentiment_records:
-            if sentiment.headline_id not in sentiment_data:
-                sentiment_data[sentiment.headline_id] = []
-            sentiment_data[sentiment.headline_id].append(sentiment)
-        
-        # Get daily recap for context
-        daily_recap = session.query(DailyRecap).filter_by(
-            simulation_id=simulation_id,
-            date=day_date
+        )).filter(
+            News.time_published >= start_datetime,
+            News.time_published < end_datetime
+        ).order_by(News.time_published, News.id, NewsSentiment.id).all()
+        
+        # Get daily recap for context. Only the trades/positions sub-documents are
+        # selected, as their stored text, and spliced into the response unparsed.
+        daily_recap = session.execute(
+            select(DailyRecap.starting_money, DailyRecap.ending_money,
+                   DailyRecap.daily_pnl.label('daily_pnl'),
+                   raw_json(DailyRecap.extra_data['trades'], '[]').label('trades'),
+                   raw_json(DailyRecap.extra_data['positions'], '{}').label('positions'))
+            .where(DailyRecap.simulation_id == simulation_id, DailyRecap.date == day_date)
         ).first()
         
         result = {
@@ -464,114 +682,94 @@ def get_day_details(simulation_id, date):
         
         # Add daily summary if available
         if daily_recap:
-            extra_data = daily_recap.extra_data or {}
             result['daily_summary'] = {
                 'starting_money': round(daily_recap.starting_money, 2),
                 'ending_money': round(daily_recap.ending_money, 2),
-                'daily_pnl': round(daily_recap.ending_money - daily_recap.starting_money, 2),
-                'trades': extra_data.get('trades', []),
-                'positions': extra_data.get('positions', {})
+                'daily_pnl': round(daily_recap.daily_pnl, 2),
+                'trades': orjson.Fragment(daily_recap.trades),
+                'positions': orjson.Fragment(daily_recap.positions)
             }
         
         # Add all news with sentiment analysis where available
-        for news in all_news:
-            sentiments = sentiment_data.get(news.id, [])
+        news_item = None
+        for row in news_rows:
+            if news_item is None or news_item['headline_id'] != row.id:
+                news_item = {
+                    'headline_id': row.id,
+                    'title': row.title,
+                    'summary': row.summary,
+                    'source': row.source,
+                    'url': row.url,
+                    'time_published': row.time_published,
+                    'sentiment_data': [],  # Array of sentiment objects
+                    'has_analysis': False
+                }
+                result['news_analysis'].append(news_item)
             
             # Convert sentiments to the same format as the other API
-            sentiment_data_list = []
-            for sentiment in sentiments:
-                sentiment_data_list.append({
-                    'id': sentiment.id,  # Add ID for similar articles dropdown
-                    'ticker': sentiment.ticker,
-                    'sentiment': sentiment.sentiment,
-                    'extra_data': sentiment.extra_data,
-                    'similar_news_faiss_ids': sentiment.similar_news_faiss_ids  # For dropdown functionality
+            if row.sentiment_id is not None:
+                news_item['sentiment_data'].append({
+                    'id': row.sentiment_id,  # Add ID for similar articles dropdown
+                    'ticker': row.ticker,
+                    'sentiment': row.sentiment,
+                    'extra_data': row.extra_data,
+                    'similar_news_faiss_ids': row.similar_news_faiss_ids  # For dropdown functionality
                 })
-            
-            news_item = {
-                'headline_id': news.id,
-                'title': news.title,
-                'summary': news.summary,
-                'source': news.source,
-                'url': news.url,
-                'time_published': news.time_published.strftime('%Y-%m-%d %H:%M:%S'),
-                'sentiment_data': sentiment_data_list,  # Array of sentiment objects
-                'has_analysis': len(sentiments) > 0
-            }
-            result['news_analysis'].append(news_item)
+                news_item['has_analysis'] = True
         
-        return jsonify(result)
+        return ojsonify(result)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
         session.close()
 
+def ticker_sentiment_summary(session, simulation_id):
+    """Per-ticker sentiment counts and score for a simulation id (negative for realtime predictions), most mentioned first"""
+    # One row per ticker with its counts pivoted by CASE/SUM in SQL
+    rows = session.execute(
+        select(
+            NewsSentiment.ticker,
+            func.sum(case((NewsSentiment.sentiment == 'positive', 1), else_=0)).label('positive'),
+            func.sum(case((NewsSentiment.sentiment == 'negative', 1), else_=0)).label('negative'),
+            func.sum(case((NewsSentiment.sentiment == 'neutral', 1), else_=0)).label('neutral'),
+            func.count().label('total')
+        ).where(
+            NewsSentiment.simulation_id == simulation_id,
+            NewsSentiment.ticker.isnot(None)  # Only include records with identified tickers
+        ).group_by(NewsSentiment.ticker).order_by(desc('total'), NewsSentiment.ticker)
+    ).all()
+    
+    # Simple sentiment score: (positive - negative) / total
+    return [{
+        'ticker': row.ticker,
+        'positive': row.positive,
+        'negative': row.negative,
+        'neutral': row.neutral,
+        'total': row.total,
+        'sentiment_score': round((row.positive - row.negative) / row.total, 3)
+    } for row in rows]
+
 @app.route('/api/simulation/<int:simulation_id>/ticker-sentiment-summary')
 def get_ticker_sentiment_summary(simulation_id):
     """Get ticker sentiment counts for a specific simulation"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
         # Check if simulation exists
-        simulation = session.query(Simulation).filter_by(id=simulation_id).first()
+        simulation = session.execute(select(Simulation.id).where(Simulation.id == simulation_id)).first()
         if not simulation:
             return jsonify({'error': 'Simulation not found'}), 404
         
         # Query to get ticker sentiment counts using efficient SQL aggregation
         # This will be much faster than counting in the frontend
-        ticker_sentiment_query = session.query(
-            NewsSentiment.ticker,
-            NewsSentiment.sentiment,
-            func.count(NewsSentiment.id).label('count')
-        ).filter(
-            NewsSentiment.simulation_id == simulation_id,
-            NewsSentiment.ticker.isnot(None)  # Only include records with identified tickers
-        ).group_by(
-            NewsSentiment.ticker,
-            NewsSentiment.sentiment
-        ).order_by(
-            NewsSentiment.ticker,
-            NewsSentiment.sentiment
-        ).all()
-        
-        # Organize the results into a structured format
-        ticker_summaries = {}
-        
-        for ticker, sentiment, count in ticker_sentiment_query:
-            if ticker not in ticker_summaries:
-                ticker_summaries[ticker] = {
-                    'ticker': ticker,
-                    'positive': 0,
-                    'negative': 0,
-                    'neutral': 0,
-                    'total': 0
-                }
-            
-            ticker_summaries[ticker][sentiment] = count
-            ticker_summaries[ticker]['total'] += count
-        
-        # Convert to list and add sentiment score calculation
-        result = []
-        for ticker_data in ticker_summaries.values():
-            # Calculate a simple sentiment score: (positive - negative) / total
-            total = ticker_data['total']
-            if total > 0:
-                sentiment_score = (ticker_data['positive'] - ticker_data['negative']) / total
-            else:
-                sentiment_score = 0
-            
-            ticker_data['sentiment_score'] = round(sentiment_score, 3)
-            result.append(ticker_data)
-        
-        # Sort by total mentions (most mentioned first)
-        result.sort(key=lambda x: x['total'], reverse=True)
+        result = ticker_sentiment_summary(session, simulation_id)
         
         return jsonify({
             'simulation_id': simulation_id,
             'ticker_sentiment_summary': result,
             'total_tickers': len(result),
-            'total_sentiment_records': sum(ticker['total'] for ticker in result)
+            'total_sentiment_records': sum(map(itemgetter('total'), result))
         })
         
     except Exception as e:
@@ -582,26 +780,21 @@ def get_ticker_sentiment_summary(simulation_id):
 @app.route('/api/simulation/<int:simulation_id>', methods=['DELETE'])
 def delete_simulation(simulation_id):
     """Delete a simulation and all its associated data"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Check if simulation exists
-        simulation = session.query(Simulation).filter_by(id=simulation_id).first()
-        if not simulation:
+        # Delete the simulation record first; a zero rowcount means it does not exist.
+        # Bulk deletes report their rowcounts, so no separate COUNT queries are needed.
+        deleted = session.query(Simulation).filter_by(id=simulation_id).delete(synchronize_session=False)
+        if not deleted:
+            session.rollback()
             return jsonify({'error': 'Simulation not found'}), 404
         
-        # Delete associated data in proper order (foreign key constraints)
-        
-        # 1. Delete news sentiment records
-        news_sentiment_count = session.query(NewsSentiment).filter_by(simulation_id=simulation_id).count()
-        session.query(NewsSentiment).filter_by(simulation_id=simulation_id).delete()
-        
-        # 2. Delete daily recap records  
-        daily_recap_count = session.query(DailyRecap).filter_by(simulation_id=simulation_id).count()
-        session.query(DailyRecap).filter_by(simulation_id=simulation_id).delete()
-        
-        # 3. Delete the simulation record itself
-        session.delete(simulation)
+        # Delete associated data (no foreign keys; news_sentiment also holds realtime rows
+        # under negative ids, so these cannot be cascaded from simulation)
+        news_sentiment_count = session.query(NewsSentiment).filter_by(simulation_id=simulation_id).delete(synchronize_session=False)
+        daily_recap_count = session.query(DailyRecap).filter_by(simulation_id=simulation_id).delete(synchronize_session=False)
+        session.query(SimulationSummary).filter_by(simulation_id=simulation_id).delete(synchronize_session=False)
         
         # Commit all deletions
         session.commit()
@@ -624,26 +817,63 @@ def delete_simulation(simulation_id):
 
 # ============== REALTIME TRADING ENDPOINTS ==============
 
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp as sent by the frontend (a trailing 'Z' means UTC)"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+class InvalidRequestBody(ValueError):
+    """A POST body that cannot be read at all (as opposed to a malformed field in it)"""
+
+def request_time_range():
+    """Return the (start_time, end_time) of a POST body, or (None, None) when it has no custom range.
+    
+    Raises InvalidRequestBody when a non-empty body is not a valid JSON object, and
+    ValueError when either timestamp is malformed.
+    """
+    data = request.get_json(silent=True)
+    if data is None:
+        # An empty body means the default range; anything else must parse
+        if request.get_data().strip():
+            raise InvalidRequestBody('Request body is not valid JSON')
+        data = {}
+    if not isinstance(data, dict):
+        raise InvalidRequestBody('Request body must be a JSON object')
+    if 'start_time' in data and 'end_time' in data:
+        for field in ('start_time', 'end_time'):
+            if not isinstance(data[field], str):
+                raise ValueError(f'{field} must be a string, got {type(data[field]).__name__}')
+        return parse_iso_datetime(data['start_time']), parse_iso_datetime(data['end_time'])
+    return None, None
+
+def with_time_range(view):
+    """Pass the request's optional time range to view as start_time/end_time keyword arguments.
+    
+    The range is parsed once here; an unreadable body or malformed timestamp is answered with 400.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            start_time, end_time = request_time_range()
+        except InvalidRequestBody as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': f'Invalid time format: {str(e)}. Use ISO format.',
+                'timestamp': datetime.now().isoformat()
+            }), 400
+        return view(*args, start_time=start_time, end_time=end_time, **kwargs)
+    return wrapper
+
 @app.route('/api/realtime/fetch-data', methods=['POST'])
-def fetch_realtime_data():
+@with_time_range
+def fetch_realtime_data(start_time, end_time):
     """Fetch fresh news data from APIs and store in database"""
     try:
-        # Get custom time range from request if provided
-        data = request.get_json() or {}
-        start_time = None
-        end_time = None
-        
-        if 'start_time' in data and 'end_time' in data:
-            try:
-                start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-            except ValueError as e:
-                return jsonify({
-                    'success': False,
-                    'error': f'Invalid time format: {str(e)}. Use ISO format.',
-                    'timestamp': datetime.now().isoformat()
-                }), 400
-        
         # Create aggregator instance
         aggregator = RealtimeNewsAggregator()
         
@@ -668,6 +898,7 @@ def fetch_realtime_data():
                 }
             }
             
+            invalidate_realtime()  # Stored news/predictions changed
             return jsonify(result)
         finally:
             aggregator.close()
@@ -681,25 +912,10 @@ def fetch_realtime_data():
 
 # Individual news API endpoints
 @app.route('/api/realtime/fetch-finnhub', methods=['POST'])
-def fetch_finnhub_data():
+@with_time_range
+def fetch_finnhub_data(start_time, end_time):
     """Fetch news data from Finnhub API only"""
     try:
-        # Get custom time range from request if provided
-        data = request.get_json() or {}
-        start_time = None
-        end_time = None
-        
-        if 'start_time' in data and 'end_time' in data:
-            try:
-                start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-            except ValueError as e:
-                return jsonify({
-                    'success': False,
-                    'error': f'Invalid time format: {str(e)}. Use ISO format.',
-                    'timestamp': datetime.now().isoformat()
-                }), 400
-        
         # Create aggregator instance
         aggregator = RealtimeNewsAggregator()
         
@@ -723,6 +939,7 @@ def fetch_finnhub_data():
                 }
             }
             
+            invalidate_realtime()  # Stored news/predictions changed
             return jsonify(result)
         finally:
             aggregator.close()
@@ -736,25 +953,10 @@ def fetch_finnhub_data():
         }), 500
 
 @app.route('/api/realtime/fetch-newsapi-ai', methods=['POST'])
-def fetch_newsapi_ai_data():
+@with_time_range
+def fetch_newsapi_ai_data(start_time, end_time):
     """Fetch news data from NewsAPI.ai only"""
     try:
-        # Get custom time range from request if provided
-        data = request.get_json() or {}
-        start_time = None
-        end_time = None
-        
-        if 'start_time' in data and 'end_time' in data:
-            try:
-                start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-            except ValueError as e:
-                return jsonify({
-                    'success': False,
-                    'error': f'Invalid time format: {str(e)}. Use ISO format.',
-                    'timestamp': datetime.now().isoformat()
-                }), 400
-        
         # Create aggregator instance
         aggregator = RealtimeNewsAggregator()
         
@@ -778,6 +980,7 @@ def fetch_newsapi_ai_data():
                 }
             }
             
+            invalidate_realtime()  # Stored news/predictions changed
             return jsonify(result)
         finally:
             aggregator.close()
@@ -794,38 +997,39 @@ def fetch_newsapi_ai_data():
 
 
 
+def run_prediction_job(start_time, end_time):
+    """Run the realtime prediction pipeline (executed on the background job pool)"""
+    # Create predictor instance with database_only mode
+    predictor = RealtimeTradingPredictor(debug=False, database_only=True)
+    
+    try:
+        # Run the prediction pipeline with custom time range if provided
+        if start_time and end_time:
+            result = predictor.run_realtime_prediction_custom_range(start_time, end_time)
+        else:
+            result = predictor.run_realtime_prediction()
+        invalidate_realtime()  # Stored news/predictions changed
+        return result
+    finally:
+        predictor.close()
+
 @app.route('/api/realtime/generate-prediction', methods=['POST'])
-def generate_realtime_prediction():
-    """Generate a new realtime trading prediction using only database data"""
+@with_time_range
+def generate_realtime_prediction(start_time, end_time):
+    """Start generating a new realtime trading prediction using only database data.
+    
+    The pipeline runs as a background job; poll /api/realtime/prediction-status/<job_id>
+    for its result.
+    """
     try:
-        # Get custom time range from request if provided
-        data = request.get_json() or {}
-        start_time = None
-        end_time = None
-        
-        if 'start_time' in data and 'end_time' in data:
-            try:
-                start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-            except ValueError as e:
-                return jsonify({
-                    'success': False,
-                    'error': f'Invalid time format: {str(e)}. Use ISO format.',
-                    'timestamp': datetime.now().isoformat()
-                }), 400
-        
-        # Create predictor instance with database_only mode
-        predictor = RealtimeTradingPredictor(debug=False, database_only=True)
-        
-        try:
-            # Run the prediction pipeline with custom time range if provided
-            if start_time and end_time:
-                result = predictor.run_realtime_prediction_custom_range(start_time, end_time)
-            else:
-                result = predictor.run_realtime_prediction()
-            return jsonify(result)
-        finally:
-            predictor.close()
+        job_id = submit_job(run_prediction_job, start_time, end_time)
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'state': 'queued',
+            'status_url': f'/api/realtime/prediction-status/{job_id}',
+            'timestamp': datetime.now().isoformat()
+        }), 202
             
     except Exception as e:
         return jsonify({
@@ -834,37 +1038,85 @@ def generate_realtime_prediction():
             'timestamp': datetime.now().isoformat()
         }), 500
 
+@app.route('/api/realtime/prediction-status/<job_id>')
+def get_prediction_job_status(job_id):
+    """Get the state of a prediction job and, once finished, the prediction result"""
+    try:
+        job = get_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Unknown or expired job'}), 404
+        
+        return jsonify({
+            'success': job['state'] != 'failed',
+            'job_id': job_id,
+            'state': job['state'],
+            'result': job['result'],
+            'error': job['error']
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# Columns of a realtime prediction sent to the client; read-only views select these as plain
+# rows rather than loading RealtimePrediction instances
+PREDICTION_COLUMNS = (RealtimePrediction.id, RealtimePrediction.timestamp, RealtimePrediction.prediction_data,
+                      RealtimePrediction.long_tickers, RealtimePrediction.short_tickers,
+                      RealtimePrediction.market_sentiment_score)
+
+# Polled realtime prediction responses are rebuilt when the predictions fingerprint changes,
+# and at least every REALTIME_CACHE_TTL seconds
+REALTIME_CACHE_TTL = 30
+
+def realtime_predictions_signature(session):
+    """Cheap fingerprint of the realtime_predictions table.
+    
+    max(id) catches inserts; the count and latest timestamp also catch a placeholder
+    prediction being deleted or filled in with its final results. Other in-place updates
+    are covered by invalidate_realtime(), called after every realtime write.
+    """
+    return tuple(session.execute(select(
+        func.max(RealtimePrediction.id),
+        func.count(RealtimePrediction.id),
+        func.max(RealtimePrediction.timestamp)
+    )).one())
+
+def build_latest_prediction(session):
+    """Build the /api/realtime/latest-prediction payload"""
+    # Get the latest prediction
+    latest_prediction = session.execute(
+        select(*PREDICTION_COLUMNS).order_by(desc(RealtimePrediction.timestamp)).limit(1)
+    ).first()
+    
+    if not latest_prediction:
+        return {
+            'success': False,
+            'message': 'No predictions found',
+            'prediction': None
+        }
+    
+    return {
+        'success': True,
+        'prediction': {
+            'id': latest_prediction.id,
+            'timestamp': latest_prediction.timestamp,
+            'prediction_data': latest_prediction.prediction_data,
+            'long_tickers': latest_prediction.long_tickers,
+            'short_tickers': latest_prediction.short_tickers,
+            'market_sentiment_score': latest_prediction.market_sentiment_score
+        }
+    }
+
 @app.route('/api/realtime/latest-prediction')
 def get_latest_realtime_prediction():
     """Get the most recent realtime prediction"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Get the latest prediction
-        latest_prediction = session.query(RealtimePrediction)\
-            .order_by(desc(RealtimePrediction.timestamp))\
-            .first()
-        
-        if not latest_prediction:
-            return jsonify({
-                'success': False,
-                'message': 'No predictions found',
-                'prediction': None
-            })
-        
-        result = {
-            'success': True,
-            'prediction': {
-                'id': latest_prediction.id,
-                'timestamp': latest_prediction.timestamp.isoformat(),
-                'prediction_data': latest_prediction.prediction_data,
-                'long_tickers': latest_prediction.long_tickers,
-                'short_tickers': latest_prediction.short_tickers,
-                'market_sentiment_score': latest_prediction.market_sentiment_score
-            }
-        }
-        
-        return jsonify(result)
+        return signature_cached_response('latest-prediction', realtime_predictions_signature(session),
+                                         REALTIME_CACHE_TTL, lambda: build_latest_prediction(session))
         
     except Exception as e:
         return jsonify({
@@ -874,33 +1126,45 @@ def get_latest_realtime_prediction():
     finally:
         session.close()
 
+def build_recent_predictions(session, page, page_size):
+    """Build the /api/realtime/predictions payload: one page of predictions, newest first"""
+    # One extra row tells whether another page follows
+    predictions = session.execute(
+        select(*PREDICTION_COLUMNS)
+        .order_by(desc(RealtimePrediction.timestamp), desc(RealtimePrediction.id))
+        .limit(page_size + 1)
+        .offset((page - 1) * page_size)
+    ).all()
+    
+    result = []
+    for pred in predictions[:page_size]:
+        result.append({
+            'id': pred.id,
+            'timestamp': pred.timestamp,
+            'prediction_data': pred.prediction_data,
+            'long_tickers': pred.long_tickers,
+            'short_tickers': pred.short_tickers,
+            'market_sentiment_score': pred.market_sentiment_score
+        })
+    
+    return {
+        'success': True,
+        'predictions': result,
+        'page': page,
+        'page_size': page_size,
+        'has_more': len(predictions) > page_size
+    }
+
 @app.route('/api/realtime/predictions')
 def get_realtime_predictions():
-    """Get recent realtime predictions"""
-    session = get_db_session()
+    """Get recent realtime predictions (?page / ?page_size, 10 per page by default)"""
+    session = get_request_session()
     
     try:
-        # Get the last 10 predictions
-        predictions = session.query(RealtimePrediction)\
-            .order_by(desc(RealtimePrediction.timestamp))\
-            .limit(10)\
-            .all()
-        
-        result = []
-        for pred in predictions:
-            result.append({
-                'id': pred.id,
-                'timestamp': pred.timestamp.isoformat(),
-                'prediction_data': pred.prediction_data,
-                'long_tickers': pred.long_tickers,
-                'short_tickers': pred.short_tickers,
-                'market_sentiment_score': pred.market_sentiment_score
-            })
-        
-        return jsonify({
-            'success': True,
-            'predictions': result
-        })
+        page, page_size = page_arguments(default_page_size=10)
+        return signature_cached_response(('recent-predictions', page, page_size),
+                                         realtime_predictions_signature(session), REALTIME_CACHE_TTL,
+                                         lambda: build_recent_predictions(session, page, page_size))
         
     except Exception as e:
         return jsonify({
@@ -915,12 +1179,15 @@ def get_realtime_ticker_sentiment_summary(prediction_id):
     """Get efficient ticker sentiment summary for a realtime prediction"""
     start_time_perf = time.time()
     
-    session = get_db_session()
+    session = get_request_session()
     
     try:
         logger.info(f"Starting efficient ticker sentiment summary for prediction {prediction_id}")
         # Get the prediction
-        prediction = session.query(RealtimePrediction).filter_by(id=prediction_id).first()
+        prediction = session.execute(
+            select(RealtimePrediction.timestamp, RealtimePrediction.prediction_data)
+            .where(RealtimePrediction.id == prediction_id)
+        ).first()
         if not prediction:
             return jsonify({'error': 'Prediction not found'}), 404
         
@@ -935,14 +1202,14 @@ def get_realtime_ticker_sentiment_summary(prediction_id):
                 
                 # Handle different types of time values
                 if isinstance(start_val, str):
-                    start_time = datetime.fromisoformat(start_val.replace('Z', '+00:00'))
+                    start_time = parse_iso_datetime(start_val)
                 elif isinstance(start_val, datetime):
                     start_time = start_val
                 else:
                     raise ValueError(f"Invalid start_time type: {type(start_val)}")
                 
                 if isinstance(end_val, str):
-                    end_time = datetime.fromisoformat(end_val.replace('Z', '+00:00'))
+                    end_time = parse_iso_datetime(end_val)
                 elif isinstance(end_val, datetime):
                     end_time = end_val
                 else:
@@ -964,59 +1231,23 @@ def get_realtime_ticker_sentiment_summary(prediction_id):
         logger.info(f"Querying existing sentiment data for prediction {prediction_id}")
         simulation_id = -prediction_id  # Realtime predictions use negative simulation_id
         
-        existing_sentiments = session.query(NewsSentiment).filter(
-            NewsSentiment.simulation_id == simulation_id,
-            NewsSentiment.ticker.isnot(None)  # Only include records with identified tickers
-        ).all()
-        
-        logger.info(f"Found {len(existing_sentiments)} existing sentiment records")
+        # Counted in SQL, so only one row per ticker is read
+        result = ticker_sentiment_summary(session, simulation_id)
+        existing_sentiment_records = sum(map(itemgetter('total'), result))
         
-        # Aggregate existing sentiment data only
-        ticker_summaries = {}
-        
-        for sentiment_record in existing_sentiments:
-            ticker = sentiment_record.ticker
-            sentiment = sentiment_record.sentiment
-            
-            if ticker not in ticker_summaries:
-                ticker_summaries[ticker] = {
-                    'ticker': ticker,
-                    'positive': 0,
-                    'negative': 0,
-                    'neutral': 0,
-                    'total': 0
-                }
-            
-            ticker_summaries[ticker][sentiment] += 1
-            ticker_summaries[ticker]['total'] += 1
+        logger.info(f"Found {existing_sentiment_records} existing sentiment records")
         
         # Get news articles count for reference (but don't analyze them)
-        news_articles_count = session.query(News).filter(
-            News.time_published >= start_time,
-            News.time_published <= end_time
-        ).count()
-        
-        # Convert to list and add sentiment score calculation
-        result = []
-        for ticker_data in ticker_summaries.values():
-            # Calculate a simple sentiment score: (positive - negative) / total
-            total = ticker_data['total']
-            if total > 0:
-                sentiment_score = (ticker_data['positive'] - ticker_data['negative']) / total
-            else:
-                sentiment_score = 0
-            
-            ticker_data['sentiment_score'] = round(sentiment_score, 3)
-            result.append(ticker_data)
-        
-        # Sort by total mentions (most mentioned first)
-        result.sort(key=lambda x: x['total'], reverse=True)
+        news_articles_count = session.execute(
+            select(func.count()).select_from(News)
+            .where(News.time_published >= start_time, News.time_published <= end_time)
+        ).scalar()
         
         end_time_perf = time.time()
         processing_time = end_time_perf - start_time_perf
         logger.info(f"Ticker sentiment summary completed in {processing_time:.2f}s for prediction {prediction_id}")
         logger.info(f"  - Total articles in range: {news_articles_count}")
-        logger.info(f"  - Existing sentiment records: {len(existing_sentiments)}")
+        logger.info(f"  - Existing sentiment records: {existing_sentiment_records}")
         logger.info(f"  - No new analysis performed (using stored data only)")
         logger.info(f"  - Total tickers found: {len(result)}")
         
@@ -1024,13 +1255,13 @@ def get_realtime_ticker_sentiment_summary(prediction_id):
             'prediction_id': prediction_id,
             'ticker_sentiment_summary': result,
             'total_tickers': len(result),
-            'total_sentiment_records': sum(ticker['total'] for ticker in result),
+            'total_sentiment_records': existing_sentiment_records,
             'time_range': {
                 'start': start_time.isoformat(),
                 'end': end_time.isoformat()
             },
             'total_articles_in_range': news_articles_count,
-            'existing_sentiment_records': len(existing_sentiments),
+            'existing_sentiment_records': existing_sentiment_records,
             'articles_analyzed_now': 0,  # No new analysis
             'used_existing_data_only': True,
             'performance_optimized': True,
@@ -1043,10 +1274,35 @@ def get_realtime_ticker_sentiment_summary(prediction_id):
     finally:
         session.close()
 
+# Filter options of realtime predictions: (simulation_id, stored record count) -> (tickers, sentiments).
+# Sentiment records are only ever added, so the count identifies the options.
+_filter_options_cache = {}
+
+def prediction_filter_options(session, simulation_id, stored_sentiment_count):
+    """Sorted distinct tickers and sentiments of a prediction's stored records, for the filter dropdowns"""
+    key = (simulation_id, stored_sentiment_count)
+    options = _filter_options_cache.get(key)
+    if options is None:
+        available_tickers = set()
+        available_sentiments = set()
+        for ticker, sentiment in session.execute(
+                select(NewsSentiment.ticker, NewsSentiment.sentiment)
+                .where(NewsSentiment.simulation_id == simulation_id).distinct()):
+            # Collect unique tickers and sentiments for filter options
+            if ticker:
+                available_tickers.add(ticker)
+            if sentiment:
+                available_sentiments.add(sentiment)
+        options = (sorted(available_tickers), sorted(available_sentiments))
+        if len(_filter_options_cache) >= 512:
+            _filter_options_cache.clear()  # Keep the cache bounded
+        _filter_options_cache[key] = options
+    return options
+
 @app.route('/api/realtime/prediction/<int:prediction_id>')
 def get_realtime_prediction_details(prediction_id):
     """Get detailed articles and sentiment data for a specific realtime prediction with pagination"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
         # Get pagination and filter parameters
@@ -1067,11 +1323,41 @@ def get_realtime_prediction_details(prediction_id):
             
         offset = (page - 1) * page_size
         
-        # Get the prediction
-        prediction = session.query(RealtimePrediction).filter_by(id=prediction_id).first()
+        # For realtime predictions, stored sentiment analysis uses negative simulation_id = -prediction_id
+        simulation_id = -prediction_id
+        is_stored = NewsSentiment.simulation_id == simulation_id
+        
+        def stored_aggregate(expression):
+            return select(expression).where(is_stored).scalar_subquery()
+        
+        # Get the prediction together with the totals over its stored sentiment records and
+        # the newest news id, in one roundtrip. The stored figures, the prediction row and the
+        # query string fingerprint the response, so a client that already has this page is
+        # answered with 304 before any article is read.
+        prediction = session.execute(
+            select(*PREDICTION_COLUMNS,
+                   stored_aggregate(func.count(NewsSentiment.id)).label('stored_sentiment_count'),
+                   stored_aggregate(func.count(NewsSentiment.headline_id.distinct())).label('total_analyzed_count'),
+                   stored_aggregate(func.max(NewsSentiment.id)).label('max_sentiment_id'),
+                   select(func.max(News.id)).scalar_subquery().label('max_news_id'))
+            .where(RealtimePrediction.id == prediction_id)
+        ).first()
         if not prediction:
             return jsonify({'error': 'Prediction not found'}), 404
         
+        stored_sentiment_count = prediction.stored_sentiment_count
+        total_analyzed_count = prediction.total_analyzed_count
+        etag = hashlib.sha1(repr((
+            prediction_id, prediction.timestamp, prediction.market_sentiment_score,
+            stored_sentiment_count, total_analyzed_count, prediction.max_sentiment_id,
+            prediction.max_news_id, request.query_string
+        )).encode()).hexdigest()
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        
         # Check if the prediction has stored time range information (from custom range)
         prediction_data = prediction.prediction_data or {}
         stored_time_range = prediction_data.get('time_range_used')
@@ -1082,194 +1368,136 @@ def get_realtime_prediction_details(prediction_id):
             end_time = datetime.fromisoformat(stored_time_range['end'])
             logger.info(f"Using stored time range for prediction {prediction_id}: {start_time} to {end_time}")
         else:
-            # Fallback to recalculating based on prediction timestamp (original logic)
-            prediction_time = prediction.timestamp
-            
-            # Use the same time range logic as RealtimeNewsAggregator.get_time_range()
-            # But apply it to the prediction timestamp, not current time
-            current_time = prediction_time.time()
-            
-            # If prediction was before 9 AM, get from previous day 5PM to prediction time
-            if current_time < datetime.strptime('09:00', '%H:%M').time():
-                end_time = prediction_time
-                start_time = prediction_time.replace(hour=17, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            else:
-                # If prediction was after 9 AM, get from previous day 5PM to same day 9AM
-                # BUT since we're looking at historical data, we need to be more flexible
-                # Let's get from previous day 5PM to the prediction time
-                start_time = prediction_time.replace(hour=17, minute=0, second=0, microsecond=0) - timedelta(days=1)
-                end_time = prediction_time
-                
-            # Skip weekends for start_time
-            while start_time.weekday() > 4:  # Saturday=5, Sunday=6
-                start_time = start_time - timedelta(days=1)
+            # Fallback to recalculating based on prediction timestamp, using the same
+            # window as RealtimeNewsAggregator.get_time_range() applied to the prediction time
+            start_time, end_time = get_news_time_range(prediction.timestamp)
             
             logger.info(f"Recalculated time range for prediction {prediction_id}: {start_time} to {end_time}")
         
-        # Get all articles in time range first (for proper counting and filtering)
-        all_articles_query = session.query(News).filter(
-            and_(
-                News.time_published >= start_time,
-                News.time_published <= end_time
-            )
-        )
-        total_articles_count = all_articles_query.count()
+        # Ticker/sentiment pairs for the filter options
+        available_tickers, available_sentiments = prediction_filter_options(
+            session, simulation_id, stored_sentiment_count)
+        
+        has_stored_data = stored_sentiment_count > 0
+        logger.info(f"Found {stored_sentiment_count} stored sentiment records for prediction {prediction_id}")
+        if not has_stored_data:
+            # For old predictions without stored data, all articles count as not analyzed
+            # This avoids expensive live analysis on every filter change
+            logger.info(f"No stored sentiment data found for prediction {prediction_id} - marking all articles as not analyzed")
+        
+        # Filters are applied in SQL: an article is analyzed when it has a stored sentiment record
+        article_filters = []
+        has_stored_sentiment = select(NewsSentiment.id).where(
+            is_stored, NewsSentiment.headline_id == News.id
+        ).exists()
+        if filter_type == 'analyzed':
+            article_filters.append(has_stored_sentiment)
+        elif filter_type == 'not-analyzed':
+            article_filters.append(~has_stored_sentiment)
+        
+        # Apply ticker and sentiment filters if specified: some stored record of the article
+        # must match both (articles without sentiment data never match). The sentiment models
+        # store uppercase tickers and lowercase sentiments, so only the request values are
+        # normalized and the columns are compared as stored.
+        if ticker_filter or sentiment_filter:
+            matching = [is_stored, NewsSentiment.headline_id == News.id]
+            if ticker_filter:
+                matching.append(NewsSentiment.ticker == ticker_filter.upper())
+            if sentiment_filter:
+                matching.append(NewsSentiment.sentiment == sentiment_filter.lower())
+            article_filters.append(select(NewsSentiment.id).where(*matching).exists())
+        
+        def count_articles(range_start, range_end):
+            """Count (all, filtered) articles in a time range with one query"""
+            filtered_count = func.count(case((and_(*article_filters), 1))) if article_filters else func.count()
+            return session.execute(
+                select(func.count(), filtered_count)
+                .select_from(News)
+                .where(News.time_published >= range_start, News.time_published <= range_end)
+            ).one()
+        
+        total_articles_count, filtered_total_count = count_articles(start_time, end_time)
         
         # If no articles found in the calculated range, expand to include the full day
         if total_articles_count == 0:
             # Expand to full day of prediction
-            day_start = prediction_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = prediction_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            all_articles_query = session.query(News).filter(
-                and_(
-                    News.time_published >= day_start,
-                    News.time_published <= day_end
-                )
-            )
-            total_articles_count = all_articles_query.count()
+            day_start = prediction.timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+            day_end = prediction.timestamp.replace(hour=23, minute=59, second=59, microsecond=999999)
+            total_articles_count, filtered_total_count = count_articles(day_start, day_end)
             
             # Update the time range for display
             start_time = day_start
             end_time = day_end
         
-        # Check if we have stored sentiment analysis for this prediction (new predictions)
-        # For realtime predictions, we use negative simulation_id = -prediction_id
-        simulation_id = -prediction_id
-        stored_sentiments = session.query(NewsSentiment).filter(
-            NewsSentiment.simulation_id == simulation_id
-        ).all()
-        
-        # Create a map of headline_id -> list of sentiment data for quick lookup
-        stored_sentiment_map = {}
-        available_tickers = set()
-        available_sentiments = set()
-        
-        for sentiment_record in stored_sentiments:
-            if sentiment_record.headline_id not in stored_sentiment_map:
-                stored_sentiment_map[sentiment_record.headline_id] = []
-            stored_sentiment_map[sentiment_record.headline_id].append({
-                'id': sentiment_record.id,  # Add ID for similar articles dropdown
-                'ticker': sentiment_record.ticker,
-                'sentiment': sentiment_record.sentiment,
-                'similar_news_faiss_ids': sentiment_record.similar_news_faiss_ids  # For dropdown functionality
-            })
-            
-            # Collect unique tickers and sentiments for filter options
-            if sentiment_record.ticker:
-                available_tickers.add(sentiment_record.ticker)
-            if sentiment_record.sentiment:
-                available_sentiments.add(sentiment_record.sentiment)
-        
-        has_stored_data = len(stored_sentiments) > 0
-        logger.info(f"Found {len(stored_sentiments)} stored sentiment records for prediction {prediction_id}")
-        
-        # Get all articles and determine analysis status from stored data
-        all_articles = all_articles_query.order_by(News.time_published.desc()).all()
-        analyzed_article_ids = set()
-        
-        if has_stored_data:
-            # Use stored sentiment data to determine which articles were analyzed
-            analyzed_article_ids = set(stored_sentiment_map.keys())
-        else:
-            # For old predictions without stored data, mark all as not analyzed
-            # This avoids expensive live analysis on every filter change
-            logger.info(f"No stored sentiment data found for prediction {prediction_id} - marking all articles as not analyzed")
-        
         # Calculate total counts
-        total_analyzed_count = len(analyzed_article_ids)
         total_not_analyzed_count = total_articles_count - total_analyzed_count
         
-        # Apply filtering if requested
-        if filter_type == 'analyzed':
-            filtered_articles = [a for a in all_articles if a.id in analyzed_article_ids]
-        elif filter_type == 'not-analyzed':
-            filtered_articles = [a for a in all_articles if a.id not in analyzed_article_ids]
-        else:  # 'all'
-            filtered_articles = all_articles
-        
-        # Apply ticker and sentiment filters if specified
-        if ticker_filter or sentiment_filter:
-            def article_matches_ticker_sentiment_filter(article):
-                # Get sentiment data for this article
-                if article.id not in stored_sentiment_map:
-                    return False  # No sentiment data means it can't match ticker/sentiment filters
-                
-                sentiment_data_list = stored_sentiment_map[article.id]
-                
-                # Check if any sentiment record matches the filters
-                for sentiment_data in sentiment_data_list:
-                    ticker_match = not ticker_filter or sentiment_data['ticker'].upper() == ticker_filter.upper()
-                    sentiment_match = not sentiment_filter or sentiment_data['sentiment'].lower() == sentiment_filter.lower()
-                    
-                    if ticker_match and sentiment_match:
-                        return True
-                
-                return False
-            
-            filtered_articles = [a for a in filtered_articles if article_matches_ticker_sentiment_filter(a)]
-        
         # Calculate pagination for filtered results
-        filtered_total_count = len(filtered_articles)
         total_pages = (filtered_total_count + page_size - 1) // page_size  # Ceiling division
         has_next = page < total_pages
         has_prev = page > 1
         
-        # Apply pagination to filtered results
-        start_idx = offset
-        end_idx = offset + page_size
-        news_articles = filtered_articles[start_idx:end_idx]
-        
         # Build article list using ONLY stored data - no live sentiment analysis
         analyzed_articles = []
-        ticker_mentions = {}
-        
-        for news_item in news_articles:
-            has_analysis = news_item.id in analyzed_article_ids
+        ticker_mentions = defaultdict(lambda: {'positive': 0, 'negative': 0, 'neutral': 0})
+        
+        # Fetch only the current page (nothing to fetch past the last one), LEFT JOINed with
+        # its stored sentiment records so articles and their (possibly several, or no)
+        # sentiments arrive in one query, grouped by article. Plain rows of the columns the
+        # response uses are read rather than ORM instances.
+        if offset < filtered_total_count:
+            page_articles = select(News.id, News.title, News.summary, News.source,
+                                   News.url, News.time_published)\
+                .where(News.time_published >= start_time, News.time_published <= end_time, *article_filters)\
+                .order_by(News.time_published.desc(), News.id.desc())\
+                .offset(offset)\
+                .limit(page_size)\
+                .subquery()
+            page_rows = session.execute(
+                select(page_articles, NewsSentiment.id.label('sentiment_id'), NewsSentiment.ticker,
+                       NewsSentiment.sentiment, NewsSentiment.similar_news_faiss_ids)
+                .select_from(page_articles)
+                .outerjoin(NewsSentiment, and_(NewsSentiment.headline_id == page_articles.c.id, is_stored))
+                .order_by(page_articles.c.time_published.desc(), page_articles.c.id.desc(), NewsSentiment.id)
+            )
             
-            if has_analysis and news_item.id in stored_sentiment_map:
-                # Use stored sentiment data (multiple ticker/sentiment pairs)
-                sentiment_data_list = stored_sentiment_map[news_item.id]
-                
-                analyzed_articles.append({
-                    'headline_id': news_item.id,
-                    'title': news_item.title,
-                    'summary': news_item.summary,
-                    'source': news_item.source,
-                    'url': news_item.url,
-                    'time_published': news_item.time_published.strftime('%Y-%m-%d %H:%M:%S'),
-                    'sentiment_data': sentiment_data_list,  # Array of {ticker, sentiment} objects
-                    'has_analysis': True,
-                    'used_for_prediction': True,
-                    'data_source': 'stored'
-                })
+            news_item = None
+            for row in page_rows:
+                if news_item is None or news_item['headline_id'] != row.id:
+                    # Articles start without stored sentiment analysis
+                    news_item = {
+                        'headline_id': row.id,
+                        'title': row.title,
+                        'summary': row.summary,
+                        'source': row.source,
+                        'url': row.url,
+                        'time_published': row.time_published,
+                        'sentiment_data': [],  # Array of {ticker, sentiment} objects
+                        'has_analysis': False,
+                        'used_for_prediction': False,
+                        'data_source': 'none'
+                    }
+                    analyzed_articles.append(news_item)
                 
-                # Track ticker mentions for summary
-                for sentiment_data in sentiment_data_list:
-                    ticker = sentiment_data['ticker']
-                    sentiment = sentiment_data['sentiment']
-                    if ticker and ticker not in ticker_mentions:
-                        ticker_mentions[ticker] = {'positive': 0, 'negative': 0, 'neutral': 0}
-                    if ticker:
-                        ticker_mentions[ticker][sentiment] += 1
-            else:
-                # Article without stored sentiment analysis
-                analyzed_articles.append({
-                    'headline_id': news_item.id,
-                    'title': news_item.title,
-                    'summary': news_item.summary,
-                    'source': news_item.source,
-                    'url': news_item.url,
-                    'time_published': news_item.time_published.strftime('%Y-%m-%d %H:%M:%S'),
-                    'sentiment_data': [],  # Empty array for consistency
-                    'has_analysis': False,
-                    'used_for_prediction': False,
-                    'data_source': 'none'
-                })
+                if row.sentiment_id is not None:
+                    # Use stored sentiment data (multiple ticker/sentiment pairs)
+                    news_item['sentiment_data'].append({
+                        'id': row.sentiment_id,  # Add ID for similar articles dropdown
+                        'ticker': row.ticker,
+                        'sentiment': row.sentiment,
+                        'similar_news_faiss_ids': row.similar_news_faiss_ids  # For dropdown functionality
+                    })
+                    news_item['has_analysis'] = True
+                    news_item['used_for_prediction'] = True
+                    news_item['data_source'] = 'stored'
+                    
+                    # Track ticker mentions for summary
+                    if row.ticker:
+                        ticker_mentions[row.ticker][row.sentiment] += 1
         
         result = {
             'prediction_id': prediction_id,
-            'timestamp': prediction.timestamp.isoformat(),
+            'timestamp': prediction.timestamp,
             'prediction_data': prediction.prediction_data,
             'long_tickers': prediction.long_tickers,
             'short_tickers': prediction.short_tickers,
@@ -1292,11 +1520,11 @@ def get_realtime_prediction_details(prediction_id):
             # Data source information
             'has_stored_sentiment_data': has_stored_data,
             'uses_live_analysis': False,  # We never do live analysis anymore
-            'stored_sentiment_count': len(stored_sentiments),
+            'stored_sentiment_count': stored_sentiment_count,
             
             # Filter options
-            'available_tickers': sorted(list(available_tickers)),
-            'available_sentiments': sorted(list(available_sentiments)),
+            'available_tickers': available_tickers,
+            'available_sentiments': available_sentiments,
             
             # Current page/filter specific data
             'current_filter': filter_type,
@@ -1308,7 +1536,7 @@ def get_realtime_prediction_details(prediction_id):
             # Legacy field for backward compatibility (current page analyzed count)
             'articles_analyzed': len([a for a in analyzed_articles if a['has_analysis']]),
             
-            'ticker_summary': ticker_mentions,
+            'ticker_summary': dict(ticker_mentions),
             'news_analysis': analyzed_articles,
             'pagination': {
                 'page': page,
@@ -1322,40 +1550,51 @@ def get_realtime_prediction_details(prediction_id):
             }
         }
         
-        return jsonify(result)
+        response = ojsonify(result)
+        response.set_etag(etag)
+        # Let browsers keep the page but revalidate it with If-None-Match on every load
+        response.cache_control.no_cache = True
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
         session.close()
 
+def prediction_status_counts(session, today_start):
+    """Latest prediction time, today's count and total count, in one scan"""
+    # Half-open range for today so the timestamp index is used
+    is_today = and_(RealtimePrediction.timestamp >= today_start,
+                    RealtimePrediction.timestamp < today_start + timedelta(days=1))
+    status = session.execute(select(
+        func.max(RealtimePrediction.timestamp).label('latest'),
+        func.count(case((is_today, 1))).label('today'),
+        func.count().label('total')
+    ).select_from(RealtimePrediction)).one()
+    return {
+        'latest_prediction_time': status.latest.isoformat() if status.latest else None,
+        'predictions_today': status.today,
+        'total_predictions': status.total
+    }
+
 @app.route('/api/realtime/prediction-status')
 def get_realtime_prediction_status():
     """Get status information about realtime predictions"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Get latest prediction timestamp
-        latest_prediction = session.query(RealtimePrediction)\
-            .order_by(desc(RealtimePrediction.timestamp))\
-            .first()
-        
-        # Count total predictions today
-        today = datetime.now().date()
-        predictions_today = session.query(RealtimePrediction)\
-            .filter(func.date(RealtimePrediction.timestamp) == today)\
-            .count()
-        
-        # Count total predictions
-        total_predictions = session.query(RealtimePrediction).count()
+        # The counts are cached for a few seconds (cleared when predictions are stored);
+        # the system time is always current
+        now = datetime.now()
+        today_start = datetime.combine(now.date(), datetime.min.time())
+        counts = cached_value('realtime', f'prediction-status:{today_start.isoformat()}', 10,
+                              lambda: prediction_status_counts(session, today_start))
         
         result = {
             'success': True,
             'status': {
-                'latest_prediction_time': latest_prediction.timestamp.isoformat() if latest_prediction else None,
-                'predictions_today': predictions_today,
-                'total_predictions': total_predictions,
-                'system_time': datetime.now().isoformat()
+                **counts,
+                'system_time': now.isoformat()
             }
         }
         
@@ -1369,51 +1608,51 @@ def get_realtime_prediction_status():
     finally:
         session.close()
 
+def data_status_counts(session, today_start, start_time, end_time):
+    """Latest news time, today's count, total count and the count in the prediction range, in one scan"""
+    # Half-open range for today so the time_published index is used
+    is_today = and_(News.time_published >= today_start,
+                    News.time_published < today_start + timedelta(days=1))
+    in_range = and_(News.time_published >= start_time, News.time_published <= end_time)
+    status = session.execute(select(
+        func.max(News.time_published).label('latest'),
+        func.count(case((is_today, 1))).label('today'),
+        func.count().label('total'),
+        func.count(case((in_range, 1))).label('in_range')
+    ).select_from(News)).one()
+    return {
+        'latest_news_time': status.latest.isoformat() if status.latest else None,
+        'news_today': status.today,
+        'total_news': status.total,
+        'articles_in_prediction_range': status.in_range
+    }
+
 @app.route('/api/realtime/data-status')
 def get_realtime_data_status():
     """Get status information about the news data in database"""
-    session = get_db_session()
+    session = get_request_session()
     
     try:
-        # Get latest news article timestamp
-        latest_news = session.query(News)\
-            .order_by(desc(News.time_published))\
-            .first()
-        
-        # Count news articles today
-        today = datetime.now().date()
-        news_today = session.query(News)\
-            .filter(func.date(News.time_published) == today)\
-            .count()
+        # Get time range that would be used for prediction (a pure function of the current
+        # time, so no aggregator, API client or session is created for it)
+        now = datetime.now()
+        start_time, end_time = get_news_time_range(now)
         
-        # Count total news articles
-        total_news = session.query(News).count()
-        
-        # Get time range that would be used for prediction
-        aggregator = RealtimeNewsAggregator()
-        start_time, end_time = aggregator.get_time_range()
-        aggregator.close()
-        
-        # Count articles in current prediction time range
-        articles_in_range = session.query(News).filter(
-            and_(
-                News.time_published >= start_time,
-                News.time_published <= end_time
-            )
-        ).count()
+        # The counts are cached for a few seconds (cleared when news is stored) per
+        # prediction window; the window end and system time are always current
+        today_start = datetime.combine(now.date(), datetime.min.time())
+        counts = cached_value('realtime', f'data-status:{today_start.isoformat()}:{start_time.isoformat()}', 10,
+                              lambda: data_status_counts(session, today_start, start_time, end_time))
         
         result = {
             'success': True,
             'data_status': {
-                'latest_news_time': latest_news.time_published.isoformat() if latest_news else None,
-                'news_today': news_today,
-                'total_news': total_news,
-                'articles_in_prediction_range': articles_in_range,
+                **counts,
                 'prediction_time_range': {
                     'start': start_time.isoformat(),
                     'end': end_time.isoformat()
                 },
-                'system_time': datetime.now().isoformat()
+                'system_time': now.isoformat()
             }
         }
         
@@ -1434,6 +1673,9 @@ def get_realtime_data_status():
 # Initialize vector search engine when the app starts
 def initialize_app():
     """Initialize application components"""
+    # Create missing tables and indices before serving, so no request waits on DDL
+    init_database()
+    
     try:
         from models.vector_db import initialize_vector_search
         success = initialize_vector_search()
@@ -1458,7 +1700,10 @@ if __name__ == '__main__':
     initialize_app()
     
     try:
-        app.run(debug=True, port=5001, threaded=True)
+        # Development server only; production runs gunicorn against wsgi.py.
+        # FLASK_DEBUG=true enables the reloader and interactive debugger.
+        debug = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
+        app.run(debug=debug, port=5001, threaded=True)
     except KeyboardInterrupt:
         print('\nShutdown requested by user')
     except Exception as e:
@@ -0,0 +1,90 @@
+"""
+Short-lived value cache for read-only API endpoints
+
+Uses Redis when REDIS_URL is set (shared by all gunicorn workers), otherwise a small
+in-process store. Cache failures never fail a request; the value is just rebuilt.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_redis = None
+if os.getenv('REDIS_URL'):
+    try:
+        import redis
+        _redis = redis.Redis.from_url(os.getenv('REDIS_URL'), socket_timeout=0.5)
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using in-process cache")
+
+# In-process fallback: key -> (expires_at, body)
+_local_cache = {}
+_local_lock = threading.Lock()
+
+
+def _get(key):
+    if _redis is not None:
+        return _redis.get(key)
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry and entry[0] > time.time():
+            return entry[1]
+    return None
+
+
+def _set(key, body, ttl):
+    if _redis is not None:
+        _redis.setex(key, ttl, body)
+        return
+    now = time.time()
+    with _local_lock:
+        if len(_local_cache) >= 1000:
+            # Keep the store bounded
+            for stale in [k for k, (expires_at, _) in _local_cache.items() if expires_at <= now]:
+                del _local_cache[stale]
+            if len(_local_cache) >= 1000:
+                _local_cache.clear()
+        _local_cache[key] = (now + ttl, body)
+
+
+def cached_value(group, key, ttl, build):
+    """Return build()'s JSON-serializable value, cached for ttl seconds under group
+    
+    For views that cache only part of their response (e.g. counts) and add fields that
+    must be fresh on every request, such as the current time.
+    """
+    key = f"api-cache:{group}:{key}"
+    try:
+        body = _get(key)
+        if body is not None:
+            return orjson.loads(body)
+    except Exception as e:
+        logger.warning(f"Value cache read failed: {e}")
+
+    value = build()
+    try:
+        _set(key, orjson.dumps(value), ttl)
+    except Exception as e:
+        logger.warning(f"Value cache write failed: {e}")
+    return value
+
+
+def invalidate(group):
+    """Drop every cached response of a group (call after writes that change its data)"""
+    prefix = f"api-cache:{group}:"
+    try:
+        if _redis is not None:
+            keys = list(_redis.scan_iter(match=f"{prefix}*"))
+            if keys:
+                _redis.delete(*keys)
+        else:
+            with _local_lock:
+                for key in [k for k in _local_cache if k.startswith(prefix)]:
+                    del _local_cache[key]
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed: {e}")
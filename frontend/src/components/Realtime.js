@@ -213,6 +213,27 @@ const Realtime = () => {
     }
   };
 
+  // Prediction generation runs as a background job; poll until it finishes
+  // (every 2 seconds, giving up after 15 minutes)
+  const waitForPredictionJob = async (jobId) => {
+    const pollIntervalMs = 2000;
+    const maxPolls = 450;
+    for (let poll = 0; poll < maxPolls; poll++) {
+      await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+      const response = await axios.get(`/api/realtime/prediction-status/${jobId}`);
+      if (response.data.state === 'finished') {
+        return response.data.result;
+      }
+      if (response.data.state === 'failed') {
+        return { success: false, error: response.data.error };
+      }
+    }
+    return {
+      success: false,
+      error: 'Prediction is still running after 15 minutes; check Recent Predictions later'
+    };
+  };
+
   const generateNewPrediction = async () => {
     setLoading(true);
     setError(null);
@@ -237,22 +258,23 @@ const Realtime = () => {
       } : {};
 
       const response = await axios.post('/api/realtime/generate-prediction', requestData);
+      const result = await waitForPredictionJob(response.data.job_id);
       
-      if (response.data.success) {
+      if (result.success) {
         setPrediction({
-          id: response.data.prediction_id,
-          timestamp: response.data.timestamp,
-          prediction_data: response.data.signals,
-          long_tickers: response.data.signals.long_signals.map(s => s.ticker),
-          short_tickers: response.data.signals.short_signals.map(s => s.ticker),
-          market_sentiment_score: response.data.signals.market_sentiment
+          id: result.prediction_id,
+          timestamp: result.timestamp,
+          prediction_data: result.signals,
+          long_tickers: result.signals.long_signals.map(s => s.ticker),
+          short_tickers: result.signals.short_signals.map(s => s.ticker),
+          market_sentiment_score: result.signals.market_sentiment
         });
         
         // Refresh other data
         loadStatus();
         loadRecentPredictions();
       } else {
-        setError(response.data.message || 'Failed to generate prediction');
+        setError(result.message || result.error || 'Failed to generate prediction');
       }
     } catch (err) {
       setError(`Error generating prediction: ${err.response?.data?.error || err.message}`);
@@ -0,0 +1,45 @@
+"""
+Gunicorn settings for the Flask backend (picked up automatically from the working directory)
+
+Every setting can be overridden with an environment variable:
+    GUNICORN_BIND          address to listen on (default 0.0.0.0:5001)
+    GUNICORN_WORKERS       worker processes (default 2 * CPUs + 1, capped at 8, when REDIS_URL
+                           is set; otherwise 1, see below)
+    GUNICORN_WORKER_CLASS  'gthread' (default), 'gevent' or 'sync'
+    GUNICORN_THREADS       threads per gthread worker (default 8)
+    GUNICORN_CONNECTIONS   concurrent requests per gevent worker (default 1000)
+    GUNICORN_TIMEOUT       seconds before a silent worker is restarted (default 120)
+
+The endpoints mostly wait on Postgres and external APIs, so threaded or gevent workers
+let one process serve other requests during those waits. gevent needs the gevent and
+psycogreen packages (pip install -r requirements-gevent.txt).
+
+Background job state (jobs.py) and cached counts (cache.py) are shared between worker
+processes only through Redis. Without REDIS_URL a single worker is run, since a job status
+poll that reached another worker would not find its job.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5001')
+if os.getenv('REDIS_URL'):
+    workers = int(os.getenv('GUNICORN_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+else:
+    workers = int(os.getenv('GUNICORN_WORKERS', 1))
+    if workers > 1:
+        raise RuntimeError("GUNICORN_WORKERS > 1 requires REDIS_URL: background job state "
+                           "is otherwise kept inside a single worker process")
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+worker_connections = int(os.getenv('GUNICORN_CONNECTIONS', 1000))
+# The /api/realtime/fetch-* endpoints wait on external news APIs within the request and can
+# take well over the 30s default (prediction generation runs as a background job)
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative under gevent so database waits yield to other requests"""
+    if worker_class == 'gevent':
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+        server.log.info("Patched psycopg2 for gevent in worker %s", worker.pid)
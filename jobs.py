@@ -0,0 +1,87 @@
+"""
+Background jobs for long-running API work
+
+A job runs on a small thread pool inside the web process, so the request that starts it
+returns immediately with a job id and the client polls for the outcome. Job state is kept
+in Redis when REDIS_URL is set (so any gunicorn worker can answer the poll), otherwise in
+a small in-process store. Without Redis, gunicorn.conf.py runs a single worker process
+(and refuses more), since a poll that lands on another worker would not find the job.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Finished job states are kept this long for the client to pick up
+JOB_TTL = int(os.getenv('JOB_TTL', 3600))
+
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv('JOB_WORKERS', 2)),
+                               thread_name_prefix='job')
+
+_redis = None
+if os.getenv('REDIS_URL'):
+    try:
+        import redis
+        _redis = redis.Redis.from_url(os.getenv('REDIS_URL'), socket_timeout=0.5)
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using in-process job store")
+
+# In-process fallback: job id -> (expires_at, state)
+_local_jobs = {}
+_local_lock = threading.Lock()
+
+
+def _save(job_id, state):
+    if _redis is not None:
+        _redis.setex(f"job:{job_id}", JOB_TTL,
+                     orjson.dumps(state, default=str,
+                                  option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    now = time.time()
+    with _local_lock:
+        for stale in [k for k, (expires_at, _) in _local_jobs.items() if expires_at <= now]:
+            del _local_jobs[stale]
+        _local_jobs[job_id] = (now + JOB_TTL, state)
+
+
+def get_job(job_id):
+    """Return a job's state dict ({'state', 'result', 'error', ...}) or None if unknown/expired"""
+    if _redis is not None:
+        body = _redis.get(f"job:{job_id}")
+        return orjson.loads(body) if body is not None else None
+    with _local_lock:
+        entry = _local_jobs.get(job_id)
+        if entry and entry[0] > time.time():
+            return entry[1]
+    return None
+
+
+def _run(job_id, func, args, submitted_at):
+    # Every failure, including a failed state write, is recorded as 'failed'
+    try:
+        _save(job_id, {'state': 'running', 'submitted_at': submitted_at, 'result': None, 'error': None})
+        result = func(*args)
+        state = {'state': 'finished', 'submitted_at': submitted_at, 'result': result, 'error': None}
+    except Exception as e:
+        logger.exception(f"Job {job_id} failed")
+        state = {'state': 'failed', 'submitted_at': submitted_at, 'result': None, 'error': str(e)}
+    try:
+        _save(job_id, state)
+    except Exception as e:
+        logger.error(f"Could not store the outcome of job {job_id}: {e}")
+
+
+def submit_job(func, *args):
+    """Queue func(*args) on the background pool and return its job id"""
+    job_id = uuid.uuid4().hex
+    submitted_at = time.time()
+    _save(job_id, {'state': 'queued', 'submitted_at': submitted_at, 'result': None, 'error': None})
+    _executor.submit(_run, job_id, func, args, submitted_at)
+    return job_id
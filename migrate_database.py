@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Database migration script
+Adds columns declared in models/database.py to tables created before them, fills their
+values for existing rows, converts json columns now stored as JSONB, drops indexes that
+newer composite indexes cover, and stores return summaries for completed simulations that
+have none. Run once after upgrading, before starting the app (the JSONB conversion
+rewrites and locks its table):
+
+    python migrate_database.py
+"""
+
+from models.database import migrate_database, get_db_session
+from models.simulation_summary import backfill_simulation_summaries
+
+
+def main():
+    added_tables = migrate_database()
+    if added_tables:
+        print(f"✓ Added new columns to: {', '.join(sorted(added_tables))}")
+    else:
+        print("✓ Database schema is up to date")
+
+    session = get_db_session()
+    try:
+        stored = backfill_simulation_summaries(session)
+        print(f"✓ Stored return summaries for {stored} completed simulations")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -85,55 +85,7 @@ class BaseSentimentModel:
                 if self.debug:
                     print(f"Raw sentiment result type: {type(result)}, value: {result}")
                 
-                # Handle different result formats more robustly
-                if isinstance(result, list):
-                    if len(result) == 0:
-                        if self.debug:
-                            print("Empty result list from sentiment analyzer")
-                        return 'neutral'
-                    
-                    # Take the first result and validate it
-                    result = result[0]
-                    
-                    # Check if the first result is still a list (nested lists)
-                    if isinstance(result, list):
-                        if len(result) > 0:
-                            result = result[0]
-                        else:
-                            if self.debug:
-                                print("Nested empty list in sentiment result")
-                            return 'neutral'
-                
-                # Ensure we have a dictionary at this point
-                if not isinstance(result, dict):
-                    if self.debug:
-                        print(f"Unexpected result format after processing: {type(result)}, value: {result}")
-                    return 'neutral'
-                
-                # Extract label safely
-                label = result.get('label', '').lower()
-                
-                # Map different label formats to standard ones
-                if label in ['positive', 'pos', 'label_2']:
-                    return 'positive'
-                elif label in ['negative', 'neg', 'label_0']:
-                    return 'negative'
-                elif label in ['neutral', 'neu', 'label_1']:
-                    return 'neutral'
-                else:
-                    # For unknown labels, try to parse from score
-                    score = result.get('score', 0)
-                    if isinstance(score, (int, float)):
-                        if score > 0.6:
-                            return 'positive' if 'positive' in label or 'pos' in label else 'negative'
-                        elif score < 0.4:
-                            return 'neutral'
-                        else:
-                            return 'neutral'
-                    else:
-                        if self.debug:
-                            print(f"Unknown label format: {label}, defaulting to neutral")
-                        return 'neutral'
+                return self._label_from_result(result)
                         
             except RuntimeError as e:
                 if "meta tensor" in str(e).lower():
@@ -150,6 +102,115 @@ class BaseSentimentModel:
                 print(f"Error analyzing sentiment: {e}")
             return 'neutral'
     
+    def _label_from_result(self, result):
+        """
+        Map one raw sentiment pipeline result to a standard sentiment label
+        
+        Args:
+            result: Pipeline output for a single headline (dict, or list of dicts with top_k)
+            
+        Returns:
+            sentiment: 'positive', 'negative', or 'neutral'
+        """
+        # Handle different result formats more robustly
+        if isinstance(result, list):
+            if len(result) == 0:
+                if self.debug:
+                    print("Empty result list from sentiment analyzer")
+                return 'neutral'
+            
+            # Take the first result and validate it
+            result = result[0]
+            
+            # Check if the first result is still a list (nested lists)
+            if isinstance(result, list):
+                if len(result) > 0:
+                    result = result[0]
+                else:
+                    if self.debug:
+                        print("Nested empty list in sentiment result")
+                    return 'neutral'
+        
+        # Ensure we have a dictionary at this point
+        if not isinstance(result, dict):
+            if self.debug:
+                print(f"Unexpected result format after processing: {type(result)}, value: {result}")
+            return 'neutral'
+        
+        # Extract label safely
+        label = result.get('label', '').lower()
+        
+        # Map different label formats to standard ones
+        if label in ['positive', 'pos', 'label_2']:
+            return 'positive'
+        elif label in ['negative', 'neg', 'label_0']:
+            return 'negative'
+        elif label in ['neutral', 'neu', 'label_1']:
+            return 'neutral'
+        else:
+            # For unknown labels, try to parse from score
+            score = result.get('score', 0)
+            if isinstance(score, (int, float)):
+                if score > 0.6:
+                    return 'positive' if 'positive' in label or 'pos' in label else 'negative'
+                elif score < 0.4:
+                    return 'neutral'
+                else:
+                    return 'neutral'
+            else:
+                if self.debug:
+                    print(f"Unknown label format: {label}, defaulting to neutral")
+                return 'neutral'
+
+    def analyze_sentiments_batch(self, pairs, batch_size=32):
+        """
+        Analyze the sentiment of many headlines with batched model calls
+        
+        Args:
+            pairs: List of (headline, ticker) tuples
+            batch_size: Number of headlines per forward pass
+            
+        Returns:
+            list: 'positive', 'negative', or 'neutral' for each pair, in order
+        """
+        sentiments = ['neutral'] * len(pairs)
+        
+        # Invalid or empty headlines stay neutral, as in analyze_headline_sentiment
+        positions = []
+        clean_headlines = []
+        for i, (headline, _ticker) in enumerate(pairs):
+            if isinstance(headline, str) and headline.strip():
+                positions.append(i)
+                clean_headlines.append(headline.strip()[:512])
+        
+        if not clean_headlines:
+            return sentiments
+        
+        try:
+            # The pipeline tokenizes each batch with padding and runs one forward pass per batch
+            results = self.sentiment_analyzer(clean_headlines, batch_size=batch_size)
+            for i, result in zip(positions, results):
+                sentiments[i] = self._label_from_result(result)
+        except Exception as e:
+            # Fall back to one call per headline so a single bad input doesn't lose the batch
+            print(f"Error in batched sentiment analysis, analyzing headlines individually: {e}")
+            for i in positions:
+                sentiments[i] = self.analyze_headline_sentiment(*pairs[i])
+        
+        return sentiments
+    
+    def extract_tickers_batch(self, titles):
+        """
+        Extract ticker symbols from many headlines
+        
+        Args:
+            titles: List of news headlines
+            
+        Returns:
+            list: Ticker symbol or None for each headline, in order
+        """
+        return [self.extract_ticker_from_headline(title) for title in titles]
+    
     def extract_ticker_from_headline(self, headline):
         """
         Extract ticker symbols from news headlines using keyword matching
@@ -407,8 +468,8 @@ class BaseSentimentModel:
         prev_date = date - timedelta(days=1)
         
         # Skip weekends
-        while prev_date.weekday() > 4:  # 5 = Saturday, 6 = Sunday
-            prev_date = prev_date - timedelta(days=1)
+        # Saturday (5) moves back 1 day and Sunday (6) 2 days, to Friday
+        prev_date -= timedelta(days=max(0, prev_date.weekday() - 4))
         
         # Query news from database for the relevant time range
         # From previous day 4PM to current day 9:30AM (market open)
@@ -438,13 +499,15 @@ class BaseSentimentModel:
             no_ticker_count = 0
             print(f"Starting sentiment analysis for {total_articles} articles...")
         
-        for i, news_item in enumerate(relevant_news, 1):
-            # Extract ticker from headline
-            ticker = self.extract_ticker_from_headline(news_item.title)
-            
+        # Extract tickers for all headlines, then run the sentiment model once over
+        # the headlines that mention a ticker instead of once per article
+        tickers = self.extract_tickers_batch([news_item.title for news_item in relevant_news])
+        sentiment_pairs = [(news_item.title, ticker) for news_item, ticker in zip(relevant_news, tickers) if ticker]
+        sentiments = iter(self.analyze_sentiments_batch(sentiment_pairs))
+        
+        for i, (news_item, ticker) in enumerate(zip(relevant_news, tickers), 1):
             if ticker:
-                # Analyze sentiment
-                sentiment = self.analyze_headline_sentiment(news_item.title, ticker)
+                sentiment = next(sentiments)
                 
                 # Store in database with simulation_id
                 self.store_sentiment_analysis(simulation_id, date, news_item, sentiment, ticker)
@@ -1,8 +1,11 @@
-from sqlalchemy import create_engine, Column, String, Float, Date, UniqueConstraint, Integer, DateTime, Index, Text, JSON, text
+from sqlalchemy import create_engine, inspect, select, update, case, Column, String, Float, Date, UniqueConstraint, Integer, DateTime, Index, Text, JSON, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session, deferred
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import JSONB
 from pgvector.sqlalchemy import Vector
 import os
+import threading
 from datetime import datetime
 
 Base = declarative_base()
@@ -34,7 +37,7 @@ class News(Base):
     summary = Column(String)
     source = Column(String)
     url = Column(String, unique=True, nullable=False)
-    time_published = Column(DateTime, nullable=False, index=True)
+    time_published = Column(DateTime, nullable=False)  # Indexed by idx_time_published
     
     __table_args__ = (
         Index('idx_time_published', 'time_published'),
@@ -50,6 +53,11 @@ class Simulation(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     executed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     extra_data = Column(JSON)  # For storing simulation results and metadata
+    # Scalars copied out of extra_data when results are stored (see simulation_summary_columns)
+    total_trades = Column(Integer)
+    sharpe_ratio = Column(Float)
+    max_drawdown_pct = Column(Float)
+    win_rate_pct = Column(Float)
     
     def __repr__(self):
         return f"<Simulation(id={self.id}, executed_at='{self.executed_at}')>"
@@ -59,8 +67,8 @@ class NewsSentiment(Base):
     __tablename__ = 'news_sentiment'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    simulation_id = Column(Integer, nullable=False, index=True)  # References simulation.id
-    date = Column(Date, nullable=False, index=True)
+    simulation_id = Column(Integer, nullable=False)  # References simulation.id
+    date = Column(Date, nullable=False)
     headline_id = Column(Integer, nullable=False)  # References news.id
     sentiment = Column(String, nullable=False)  # 'positive', 'negative', 'neutral'
     ticker = Column(String)  # Extracted ticker from headline
@@ -68,9 +76,16 @@ class NewsSentiment(Base):
     similar_news_faiss_ids = Column(JSON)  # Array of [faiss_id, similarity_score] pairs for similar news articles
     
     __table_args__ = (
-        Index('idx_news_sentiment_simulation', 'simulation_id'),
         Index('idx_news_sentiment_date', 'date'),
         Index('idx_news_sentiment_ticker', 'ticker'),
+        # Covers the day-detail join on (simulation_id, date, headline_id); its prefix serves
+        # (simulation_id, date) and simulation_id lookups
+        Index('idx_news_sentiment_simulation_date_headline', 'simulation_id', 'date', 'headline_id'),
+        # Covers the per-simulation ticker/sentiment GROUP BY counts (index-only scan)
+        Index('idx_news_sentiment_simulation_ticker_sentiment', 'simulation_id', 'ticker', 'sentiment'),
+        # Serves the per-article EXISTS filters and page lookups of realtime prediction details,
+        # which match (simulation_id, headline_id) without a date
+        Index('idx_news_sentiment_simulation_headline', 'simulation_id', 'headline_id'),
     )
     
     def __repr__(self):
@@ -81,26 +96,69 @@ class DailyRecap(Base):
     __tablename__ = 'daily_recap'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    simulation_id = Column(Integer, nullable=False, index=True)  # References simulation.id
-    date = Column(Date, nullable=False, index=True)
+    simulation_id = Column(Integer, nullable=False)  # References simulation.id
+    date = Column(Date, nullable=False)
     starting_money = Column(Float, nullable=False)
     ending_money = Column(Float, nullable=False)
-    extra_data = Column(JSON)  # Contains shorts, longs, and returns for each action
+    # Contains shorts, longs, and returns for each action. Deferred because it is
+    # by far the largest column; queries that need it use undefer(). Stored as JSONB on
+    # Postgres so sub-paths like extra_data['trades'] are read without re-parsing the document.
+    extra_data = deferred(Column(JSON().with_variant(JSONB(), 'postgresql')))
+    # Counts copied out of extra_data on write (see daily_recap_summary_columns)
+    num_long_positions = Column(Integer)
+    num_short_positions = Column(Integer)
+    total_trades = Column(Integer)
     
     __table_args__ = (
-        Index('idx_daily_recap_simulation', 'simulation_id'),
         Index('idx_daily_recap_date', 'date'),
+        # Serves per-simulation scans in date order; its prefix serves simulation_id lookups
+        Index('idx_daily_recap_simulation_date', 'simulation_id', 'date'),
     )
     
+    # Shared by every view; usable both on instances and as SQL expressions in queries
+    @hybrid_property
+    def daily_pnl(self):
+        """Profit or loss for the day"""
+        return self.ending_money - self.starting_money
+    
+    @hybrid_property
+    def daily_return(self):
+        """Daily return in percent (0 when there was no starting money)"""
+        if self.starting_money > 0:
+            return (self.ending_money - self.starting_money) / self.starting_money * 100
+        return 0
+    
+    @daily_return.expression
+    def daily_return(cls):
+        return case(
+            (cls.starting_money > 0, (cls.ending_money - cls.starting_money) / cls.starting_money * 100),
+            else_=0
+        )
+    
     def __repr__(self):
         return f"<DailyRecap(id={self.id}, simulation_id={self.simulation_id}, date='{self.date}', starting_money={self.starting_money}, ending_money={self.ending_money})>"
 
 
+class SimulationSummary(Base):
+    __tablename__ = 'simulation_summary'
+
+    # Precomputed return series for a completed simulation, written at the end of a run
+    simulation_id = Column(Integer, primary_key=True)  # References simulation.id
+    dates = Column(JSON, nullable=False)  # List of 'YYYY-MM-DD' trading dates
+    daily_returns = Column(JSON, nullable=False)  # Daily returns in percent, rounded to 2 decimals
+    cumulative_returns = Column(JSON, nullable=False)  # Cumulative returns in percent, rounded to 2 decimals
+    final_return = Column(Float, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SimulationSummary(simulation_id={self.simulation_id}, final_return={self.final_return})>"
+
+
 class RealtimePrediction(Base):
     __tablename__ = 'realtime_predictions'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)  # Indexed by idx_realtime_predictions_timestamp
     prediction_data = Column(JSON, nullable=False)  # Full prediction data
     long_tickers = Column(JSON)  # List of tickers for long positions
     short_tickers = Column(JSON)  # List of tickers for short positions
@@ -151,9 +209,56 @@ class NewsFaiss(Base):
     ticker_metadata = Column(JSON, nullable=False)
 
 
+def simulation_summary_columns(extra_data):
+    """Return the Simulation scalar columns derived from its extra_data"""
+    extra_data = extra_data or {}
+    metrics = extra_data.get('metrics') or {}
+    return {
+        'total_trades': extra_data.get('total_trades'),
+        'sharpe_ratio': metrics.get('sharpe_ratio'),
+        'max_drawdown_pct': metrics.get('max_drawdown_pct'),
+        'win_rate_pct': metrics.get('win_rate_pct')
+    }
+
+def daily_recap_summary_columns(extra_data):
+    """Return the DailyRecap count columns derived from its extra_data"""
+    extra_data = extra_data or {}
+    # Count net positions at end of day, not individual trades (single pass)
+    num_long_positions = num_short_positions = 0
+    for position in extra_data.get('positions') or []:
+        position_type = position.get('position_type')
+        if position_type == 'long':
+            num_long_positions += 1
+        elif position_type == 'short':
+            num_short_positions += 1
+    return {
+        'num_long_positions': num_long_positions,
+        'num_short_positions': num_short_positions,
+        'total_trades': len(extra_data.get('trades') or [])
+    }
+
+
 _engine = None
 _Session = None
+_RequestSession = None
 _db_initialized = False
+_init_lock = threading.Lock()
+
+# Postgres advisory lock key serializing schema changes across processes
+SCHEMA_LOCK_KEY = 5005001
+
+# Indexes created by earlier versions of the models that a declared index now covers
+# (dropped by migrate_database.py; each only slowed down inserts)
+SUPERSEDED_INDEXES = (
+    'ix_news_time_published',               # idx_time_published
+    'ix_news_sentiment_simulation_id',      # idx_news_sentiment_simulation_date_headline
+    'idx_news_sentiment_simulation',        # idx_news_sentiment_simulation_date_headline
+    'ix_news_sentiment_date',               # idx_news_sentiment_date
+    'ix_daily_recap_simulation_id',         # idx_daily_recap_simulation_date
+    'idx_daily_recap_simulation',           # idx_daily_recap_simulation_date
+    'ix_daily_recap_date',                  # idx_daily_recap_date
+    'ix_realtime_predictions_timestamp',    # idx_realtime_predictions_timestamp
+)
 
 #def get_engine():
 #    db_user = os.getenv('POSTGRES_USER', 'postgres')
@@ -178,19 +283,141 @@ def get_engine():
         db_port = os.getenv('POSTGRES_PORT', '5432')
         db_name = os.getenv('POSTGRES_DB', 'trading_data')
         db_url = f'postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
+        # Connection pool shared by all sessions of this process
+        return create_engine(
+            db_url,
+            echo=False,
+            pool_size=int(os.getenv('DB_POOL_SIZE', '20')),
+            max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '10')),
+            pool_pre_ping=True,  # Drop connections closed by the server instead of failing a request
+            pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '1800')),
+            # Room for every distinct statement the app issues, so none is recompiled after eviction
+            query_cache_size=int(os.getenv('DB_QUERY_CACHE_SIZE', '1200')),
+            # Batch executemany UPDATE/DELETEs too (INSERTs already use multi-row VALUES)
+            executemany_mode='values_plus_batch',
+            echo_pool=os.getenv('DB_ECHO_POOL', 'false').lower() == 'true'
+        )
 
     return create_engine(db_url, echo=False)
 
+def _schema_lock(conn):
+    """Hold a transaction-scoped advisory lock so only one process changes the schema at a time"""
+    if conn.dialect.name == 'postgresql':
+        conn.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': SCHEMA_LOCK_KEY})
+
 def init_database():
-    """Initialize the database (create tables, keys, and indices if they do not exist)"""
+    """Initialize the database (create tables, keys, and indices if they do not exist)
+    
+    Only idempotent CREATEs run here. Changes to existing tables (new columns and their
+    backfill) are applied by migrate_database.py.
+    """
     global _db_initialized, _engine
-    if not _db_initialized:
+    if _db_initialized:
+        return
+    with _init_lock:
+        if _db_initialized:
+            return
         if _engine is None:
             _engine = get_engine()
-        Base.metadata.create_all(_engine)  # Idempotent
+        with _engine.begin() as conn:
+            _schema_lock(conn)
+            Base.metadata.create_all(conn)  # Idempotent
+            # create_all only builds indices for tables it creates, so add any indices
+            # declared after an existing table was first created
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+        missing = _missing_columns(_engine)
+        if missing:
+            print(f"⚠ Database schema is out of date (missing {', '.join(missing)}); "
+                  f"run migrate_database.py")
         _db_initialized = True
         print("Database initialized successfully")
 
+def migrate_database():
+    """Bring existing tables up to date with the models (run by migrate_database.py)
+    
+    Adds columns declared after a table was first created, converts json columns now
+    declared as JSONB (a table rewrite under an exclusive lock), drops superseded indexes,
+    and fills the summary columns of existing rows.
+    """
+    init_database()
+    with _engine.begin() as conn:
+        _schema_lock(conn)
+        added_columns = _add_missing_columns(conn)
+        _convert_columns_to_jsonb(conn)
+        for index_name in SUPERSEDED_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS {index_name}'))
+    if added_columns:
+        _backfill_summary_columns(_engine, added_columns)
+    return added_columns
+
+def _missing_columns(engine):
+    """Return 'table.column' names declared in the models but absent from existing tables"""
+    inspector = inspect(engine)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        missing += [f'{table.name}.{column.name}' for column in table.columns if column.name not in existing]
+    return missing
+
+def _add_missing_columns(conn):
+    """Add columns declared after an existing table was first created. Returns the added table names."""
+    inspector = inspect(conn)
+    added_tables = set()
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added_tables.add(table.name)
+    return added_tables
+
+def _convert_columns_to_jsonb(conn):
+    """Convert existing json columns that are now declared as JSONB (a one-time table rewrite)"""
+    if conn.dialect.name != 'postgresql':
+        return
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name']: column['type'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if (isinstance(column.type.dialect_impl(conn.dialect), JSONB)
+                    and column.name in existing and not isinstance(existing[column.name], JSONB)):
+                conn.execute(text(f'ALTER TABLE {table.name} ALTER COLUMN {column.name} '
+                                  f'TYPE jsonb USING {column.name}::jsonb'))
+
+def _backfill_summary_columns(engine, added_tables, batch_size=1000):
+    """Fill newly added summary columns of existing rows from their extra_data"""
+    with sessionmaker(bind=engine)() as session:
+        for model, columns_from in ((Simulation, simulation_summary_columns),
+                                    (DailyRecap, daily_recap_summary_columns)):
+            if model.__tablename__ not in added_tables:
+                continue
+            last_id = 0
+            while True:
+                # Page by primary key so no cursor is held open across the updates
+                rows = session.execute(
+                    select(model.id, model.extra_data)
+                    .where(model.id > last_id)
+                    .order_by(model.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                # ORM bulk UPDATE by primary key
+                session.execute(update(model), [
+                    {'id': row.id, **columns_from(row.extra_data)} for row in rows
+                ])
+                last_id = rows[-1].id
+        session.commit()
+
 def get_db_session():
     """Create and return a database session. Initializes DB schema only once per process."""
     global _engine, _Session
@@ -200,4 +427,20 @@ def get_db_session():
         _Session = sessionmaker(bind=_engine)
     # Ensure DB is initialized only once
     init_database()
-    return _Session()
\ No newline at end of file
+    return _Session()
+
+def get_request_session():
+    """Return the current thread's web request session (released by remove_request_session)"""
+    global _engine, _RequestSession
+    if _engine is None:
+        _engine = get_engine()
+    if _RequestSession is None:
+        # expire_on_commit=False so objects stay readable after commit without re-selecting
+        _RequestSession = scoped_session(sessionmaker(bind=_engine, expire_on_commit=False))
+    # The schema is set up by init_database() at start-up (initialize_app), not per request
+    return _RequestSession()
+
+def remove_request_session():
+    """Close the current thread's request session and return its connection to the pool"""
+    if _RequestSession is not None:
+        _RequestSession.remove()
@@ -361,8 +361,8 @@ Example response format:
         prev_date = date - timedelta(days=1)
         
         # Skip weekends
-        while prev_date.weekday() > 4:  # 5 = Saturday, 6 = Sunday
-            prev_date = prev_date - timedelta(days=1)
+        # Saturday (5) moves back 1 day and Sunday (6) 2 days, to Friday
+        prev_date -= timedelta(days=max(0, prev_date.weekday() - 4))
         
         # Query news from database for the relevant time range
         # From previous day 4PM to current day 9:30AM (market open)
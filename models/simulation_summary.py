@@ -0,0 +1,145 @@
+from collections import defaultdict
+from datetime import datetime
+from models.database import DailyRecap, Simulation, SimulationSummary
+from sqlalchemy import func, select
+import math
+import numpy as np
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def round_returns(values):
+    """Round a sequence of percentage returns to 2 decimals, treating NULLs as 0"""
+    return np.nan_to_num(np.array(values, dtype=np.float64)).round(2).tolist()
+
+
+def compute_simulation_returns(session, simulation_ids=None):
+    """
+    Compute the daily and cumulative return series for simulations in one SQL scan
+
+    Args:
+        session: Database session
+        simulation_ids: Optional list of simulation IDs to restrict the scan to
+
+    Returns:
+        dict: simulation_id -> {'dates', 'daily_returns', 'cumulative_returns', 'final_return'}
+    """
+    # The first day's starting money is taken with a window function, and rows
+    # come back as plain tuples so no DailyRecap objects are built
+    initial_value = func.first_value(DailyRecap.starting_money).over(
+        partition_by=DailyRecap.simulation_id,
+        order_by=DailyRecap.date
+    )
+    returns_query = select(
+        DailyRecap.simulation_id,
+        DailyRecap.date,
+        DailyRecap.daily_return.label('daily_return'),
+        ((DailyRecap.ending_money - initial_value) / func.nullif(initial_value, 0) * 100).label('cumulative_return')
+    ).order_by(DailyRecap.simulation_id, DailyRecap.date)
+    if simulation_ids is not None:
+        returns_query = returns_query.where(DailyRecap.simulation_id.in_(simulation_ids))
+
+    # Collect each simulation's rows column-wise so the rounding below is vectorized.
+    # Rows arrive grouped by simulation, so the list appends are rebound only when it changes.
+    columns_by_simulation = defaultdict(lambda: ([], [], []))
+    current_id = None
+    for simulation_id, day, daily_return, cumulative_return in session.execute(returns_query):
+        if simulation_id != current_id:
+            current_id = simulation_id
+            dates, daily_values, cumulative_values = columns_by_simulation[simulation_id]
+            add_date, add_daily, add_cumulative = dates.append, daily_values.append, cumulative_values.append
+        add_date(day.isoformat())
+        add_daily(daily_return)
+        add_cumulative(cumulative_return)
+
+    returns = {}
+    for simulation_id, (dates, daily_values, cumulative_values) in columns_by_simulation.items():
+        cumulative_returns = round_returns(cumulative_values)
+        returns[simulation_id] = {
+            'dates': dates,
+            'daily_returns': round_returns(daily_values),
+            'cumulative_returns': cumulative_returns,
+            'final_return': cumulative_returns[-1] if cumulative_returns else 0
+        }
+    return returns
+
+
+def store_simulation_summaries(session, returns):
+    """
+    Insert or replace simulation_summary rows (caller commits)
+
+    Args:
+        session: Database session
+        returns: dict as returned by compute_simulation_returns()
+    """
+    for simulation_id, series in returns.items():
+        session.merge(SimulationSummary(
+            simulation_id=simulation_id,
+            updated_at=datetime.utcnow(),
+            **series
+        ))
+
+
+def refresh_simulation_summary(session, simulation_id):
+    """
+    Recompute and store the summary for one simulation (caller commits)
+
+    Args:
+        session: Database session
+        simulation_id: The simulation ID
+    """
+    store_simulation_summaries(session, compute_simulation_returns(session, [simulation_id]))
+
+
+def backfill_simulation_summaries(session, batch_size=100):
+    """
+    Store summaries for completed simulations that have none (run by migrate_database.py)
+
+    Args:
+        session: Database session
+        batch_size: Simulations computed and committed per batch
+
+    Returns:
+        int: Number of summaries stored
+    """
+    missing_ids = session.execute(
+        select(Simulation.id)
+        .where(Simulation.extra_data['completed_at'].as_string().isnot(None))
+        .where(~select(SimulationSummary.simulation_id)
+               .where(SimulationSummary.simulation_id == Simulation.id).exists())
+        .order_by(Simulation.id)
+    ).scalars().all()
+
+    stored = 0
+    for start in range(0, len(missing_ids), batch_size):
+        returns = compute_simulation_returns(session, missing_ids[start:start + batch_size])
+        store_simulation_summaries(session, returns)
+        session.commit()
+        stored += len(returns)
+    return stored
+
+
+def return_metrics(returns_pct):
+    """
+    Compute the Sharpe ratio and maximum drawdown of a series of daily returns
+
+    Args:
+        returns_pct: Sequence of daily returns in percent
+
+    Returns:
+        tuple: (annualized Sharpe ratio over 252 trading days, max drawdown in percent (<= 0))
+    """
+    returns_pct = np.asarray(returns_pct, dtype=np.float64)
+    if returns_pct.size == 0:
+        return 0.0, 0.0
+
+    # Sample standard deviation (ddof=1), undefined for a single day
+    std = returns_pct.std(ddof=1) if returns_pct.size > 1 else 0.0
+    sharpe_ratio = (returns_pct.mean() * TRADING_DAYS_PER_YEAR) / (std * math.sqrt(TRADING_DAYS_PER_YEAR)) if std > 0 else 0
+
+    # Drawdown of the compounded equity curve from its running peak; days after a total
+    # loss (peak of 0) count as no further drawdown
+    equity = np.cumprod(1.0 + returns_pct / 100.0)
+    peak = np.maximum.accumulate(equity)
+    drawdown = np.divide(equity - peak, peak, out=np.zeros_like(equity), where=peak > 0)
+    return float(sharpe_ratio), float(drawdown.min() * 100.0)
@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 from models.base_sentiment_model import BaseSentimentModel
 from models.database import get_db_session, init_database, Simulation, DailyRecap, NewsSentiment
+from models.database import simulation_summary_columns, daily_recap_summary_columns
+from models.simulation_summary import refresh_simulation_summary, return_metrics
 from data_fetchers.stock_price_fetcher import StockPriceFetcher
 from sqlalchemy import and_
+from sqlalchemy.orm import undefer
 from sqlalchemy.orm.attributes import flag_modified
-import pandas as pd
 import json
 import os
 
@@ -74,6 +76,10 @@ class StockSimulation:
                     'total_trades': len(self.trade_history),
                     'trading_days': len(self.daily_returns)
                 }
+                for column, value in simulation_summary_columns(simulation.extra_data).items():
+                    setattr(simulation, column, value)
+                # Precompute the return series served by /api/simulations
+                refresh_simulation_summary(self.db_session, self.simulation_id)
                 self.db_session.commit()
                 print(f"Updated simulation {self.simulation_id} with final results")
             else:
@@ -121,6 +127,8 @@ class StockSimulation:
                 existing.starting_money = starting_money
                 existing.ending_money = ending_money
                 existing.extra_data = positions_extra_data
+                for column, value in daily_recap_summary_columns(positions_extra_data).items():
+                    setattr(existing, column, value)
             else:
                 # Create new record
                 daily_recap = DailyRecap(
@@ -128,7 +136,8 @@ class StockSimulation:
                     date=date,
                     starting_money=starting_money,
                     ending_money=ending_money,
-                    extra_data=positions_extra_data
+                    extra_data=positions_extra_data,
+                    **daily_recap_summary_columns(positions_extra_data)
                 )
                 self.db_session.add(daily_recap)
             
@@ -172,6 +181,7 @@ class StockSimulation:
         
         position_size = self.position_size  # Fixed position size
         new_positions = []
+        trade_date = date.isoformat()  # Formatted once for every trade of the day
         
         # Open long positions at market open
         for ticker in signals['long']:
@@ -185,7 +195,7 @@ class StockSimulation:
                 }
                 
                 trade = {
-                    'date': date.strftime('%Y-%m-%d'),
+                    'date': trade_date,
                     'ticker': ticker,
                     'action': 'buy',
                     'shares': round(shares, 2),
@@ -225,7 +235,7 @@ class StockSimulation:
                 }
                 
                 trade = {
-                    'date': date.strftime('%Y-%m-%d'),
+                    'date': trade_date,
                     'ticker': ticker,
                     'action': 'sell',
                     'shares': round(shares, 2),
@@ -279,6 +289,7 @@ class StockSimulation:
         daily_pnl = 0
         closing_trades = []
         position_details = []
+        trade_date = date.isoformat()  # Formatted once for every trade of the day
         
         # Close long positions at market close
         for ticker, position in list(self.positions['long'].items()):
@@ -313,7 +324,7 @@ class StockSimulation:
                 
                 # Add closing trade
                 closing_trade = {
-                    'date': date.strftime('%Y-%m-%d'),
+                    'date': trade_date,
                     'ticker': ticker,
                     'action': 'sell',
                     'shares': round(shares, 2),
@@ -360,7 +371,7 @@ class StockSimulation:
                 
                 # Add closing trade
                 closing_trade = {
-                    'date': date.strftime('%Y-%m-%d'),
+                    'date': trade_date,
                     'ticker': ticker,
                     'action': 'buy',  # Covering a short is buying
                     'shares': round(shares, 2),
@@ -407,7 +418,7 @@ class StockSimulation:
         Update the daily recap with closing trade information and final P&L
         """
         try:
-            existing = self.db_session.query(DailyRecap).filter(
+            existing = self.db_session.query(DailyRecap).options(undefer(DailyRecap.extra_data)).filter(
                 and_(
                     DailyRecap.simulation_id == self.simulation_id,
                     DailyRecap.date == date
@@ -431,6 +442,8 @@ class StockSimulation:
                 
                 existing.ending_money = ending_money
                 existing.extra_data = extra_data
+                for column, value in daily_recap_summary_columns(extra_data).items():
+                    setattr(existing, column, value)
                 
                 # CRITICAL: Flag the JSON field as modified so SQLAlchemy detects the change
                 flag_modified(existing, 'extra_data')
@@ -506,24 +519,10 @@ class StockSimulation:
                 'total_trades': 0
             }
         
-        df = pd.DataFrame(self.daily_returns)
-        
         total_return = ((self.portfolio_value - 100000) / 100000) * 100
         
-        # Calculate Sharpe ratio (assuming 252 trading days per year)
-        if len(df) > 0:
-            daily_returns = df['return_pct'].values
-            avg_daily_return = daily_returns.mean()
-            std_daily_return = daily_returns.std()
-            sharpe_ratio = (avg_daily_return * 252) / (std_daily_return * (252 ** 0.5)) if std_daily_return > 0 else 0
-        else:
-            sharpe_ratio = 0
-        
-        # Calculate maximum drawdown
-        cumulative_returns = (1 + df['return_pct'] / 100).cumprod()
-        running_max = cumulative_returns.expanding().max()
-        drawdown = (cumulative_returns - running_max) / running_max
-        max_drawdown = drawdown.min() * 100
+        # Sharpe ratio (assuming 252 trading days per year) and maximum drawdown
+        sharpe_ratio, max_drawdown = return_metrics([day['return_pct'] for day in self.daily_returns])
         
         # Win rate
         winning_trades = len([t for t in self.trade_history if t.get('pnl', 0) > 0])
@@ -7,6 +7,7 @@ financial news by semantic similarity.
 
 import os
 import pickle
+import threading
 import numpy as np
 from typing import List, Tuple, Optional
 import faiss
@@ -217,16 +218,21 @@ class VectorSearchEngine:
 
 # Global instance for easy access
 vector_search = VectorSearchEngine()
+_vector_search_lock = threading.Lock()
 
 
 def initialize_vector_search() -> bool:
     """
-    Initialize the global vector search engine
+    Initialize the global vector search engine. The index and embedding model are
+    loaded once per process; later calls (e.g. from each new LLMSentimentModel) reuse them.
     
     Returns:
         True if initialization successful, False otherwise
     """
-    return vector_search.load()
+    with _vector_search_lock:
+        if vector_search.is_loaded:
+            return True
+        return vector_search.load()
 
 
 def search_news(query: str, k: int = 10) -> List[Tuple[NewsFaiss, float]]:
@@ -7,7 +7,8 @@ Combines multiple news APIs to get comprehensive coverage
 import os
 import requests
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time as dt_time
 from typing import List, Dict, Optional
 import logging
 import pytz
@@ -19,6 +20,22 @@ from sqlalchemy import and_
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# News windows start at 5 PM on the previous weekday
+FIVE_PM = dt_time(17, 0)
+ONE_DAY = timedelta(days=1)
+
+def get_news_time_range(now: datetime):
+    """
+    Get the news window for a prediction made at `now`: previous day 5PM (moved back to
+    Friday over weekends) to `now`
+    """
+    # Whether `now` is before or after 9 AM, the window runs from yesterday 5PM to now
+    start_time = datetime.combine(now.date() - ONE_DAY, FIVE_PM, tzinfo=now.tzinfo)
+    # Skip weekends for start_time
+    # Saturday (5) moves back 1 day and Sunday (6) 2 days, to Friday
+    start_time -= timedelta(days=max(0, start_time.weekday() - 4))
+    return start_time, now
+
 class RealtimeNewsAggregator:
     def __init__(self):
         """Initialize all news API clients"""
@@ -37,29 +54,15 @@ class RealtimeNewsAggregator:
         """
         Get the time range: previous day 5PM to current day 9AM or current time (whichever is earlier)
         """
-        now = datetime.now()
-        current_time = now.time()
-        
-        # If it's before 9 AM today, get from yesterday 5PM to now
-        if current_time < datetime.strptime('09:00', '%H:%M').time():
-            end_time = now
-            start_time = now.replace(hour=17, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        else:
-            # If it's after 9 AM, get from yesterday 5PM to current time
-            start_time = now.replace(hour=17, minute=0, second=0, microsecond=0) - timedelta(days=1)
-            end_time = now
-            
-        # Skip weekends for start_time
-        while start_time.weekday() > 4:  # Saturday=5, Sunday=6
-            start_time = start_time - timedelta(days=1)
-            
+        start_time, end_time = get_news_time_range(datetime.now())
         logger.info(f"News time range: {start_time} to {end_time}")
         return start_time, end_time
 
 
 
-    def fetch_finnhub_news(self, start_time: datetime, end_time: datetime) -> int:
+    def fetch_finnhub_news(self, start_time: datetime, end_time: datetime, db_session=None) -> int:
         """Fetch company-specific news from Finnhub for all tickers and save directly to DB"""
+        db_session = db_session or self.db_session
         total_saved = 0
         
         if not self.finnhub_client:
@@ -122,12 +125,12 @@ class RealtimeNewsAggregator:
                                             url=article.get('url', ''),
                                             time_published=published
                                         )
-                                        self.db_session.add(news_item)
-                                        self.db_session.commit()  # Commit immediately
+                                        db_session.add(news_item)
+                                        db_session.commit()  # Commit immediately
                                         ticker_saved += 1
                                     except Exception as db_e:
                                         # Unique constraint violation or other DB error - skip this article
-                                        self.db_session.rollback()
+                                        db_session.rollback()
                                         continue
                                         
                             except Exception as e:
@@ -151,8 +154,9 @@ class RealtimeNewsAggregator:
             
         return total_saved
 
-    def fetch_newsapi_ai_news(self, start_time: datetime, end_time: datetime) -> int:
+    def fetch_newsapi_ai_news(self, start_time: datetime, end_time: datetime, db_session=None) -> int:
         """Fetch news from NewsAPI.ai for all tickers and save directly to DB"""
+        db_session = db_session or self.db_session
         total_saved = 0
         
         if not self.newsapi_ai_key:
@@ -399,13 +403,13 @@ class RealtimeNewsAggregator:
                                             url=url,
                                             time_published=published  # Already in UTC
                                         )
-                                        self.db_session.add(news_item)
-                                        self.db_session.commit()  # Commit immediately
+                                        db_session.add(news_item)
+                                        db_session.commit()  # Commit immediately
                                         ticker_saved += 1
                                         logger.debug(f"    Saved article: {title[:60]}...")
                                     except Exception as db_e:
                                         # Unique constraint violation or other DB error - skip this article
-                                        self.db_session.rollback()
+                                        db_session.rollback()
                                         logger.debug(f"    Skipped duplicate article: {title[:60]}...")
                                         continue
                                 else:
@@ -449,27 +453,41 @@ class RealtimeNewsAggregator:
         
         logger.info(f"Starting news aggregation for range: {start_time} to {end_time}")
         
-        # Prioritize Finnhub company news as the main source for ticker-specific news
-        try:
-            logger.info("Fetching from Finnhub company news (PRIMARY SOURCE)...")
-            finnhub_saved = self.fetch_finnhub_news(start_time, end_time)
-            total_saved += finnhub_saved
-            logger.info(f"Saved {finnhub_saved} articles from Finnhub company news")
-        except Exception as e:
-            logger.error(f"Failed to fetch from Finnhub: {e}")
-        
-        # Add NewsAPI.ai as secondary source for company-specific news
-        try:
-            logger.info("Fetching from NewsAPI.ai company news (SECONDARY SOURCE)...")
-            newsapi_ai_saved = self.fetch_newsapi_ai_news(start_time, end_time)
-            total_saved += newsapi_ai_saved
-            logger.info(f"Saved {newsapi_ai_saved} articles from NewsAPI.ai")
-        except Exception as e:
-            logger.error(f"Failed to fetch from NewsAPI.ai: {e}")
+        # The two sources are independent, network-bound jobs: run them side by side
+        # so the wall time is the slower of the two rather than their sum
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Finnhub company news is the main source for ticker-specific news
+            finnhub_future = executor.submit(self.fetch_finnhub_news, start_time, end_time)
+            # NewsAPI.ai is the secondary source; it gets its own session since
+            # SQLAlchemy sessions must not be shared across threads
+            newsapi_ai_future = executor.submit(self._fetch_with_own_session,
+                                                self.fetch_newsapi_ai_news, start_time, end_time)
+            
+            try:
+                finnhub_saved = finnhub_future.result()
+                total_saved += finnhub_saved
+                logger.info(f"Saved {finnhub_saved} articles from Finnhub company news")
+            except Exception as e:
+                logger.error(f"Failed to fetch from Finnhub: {e}")
+            
+            try:
+                newsapi_ai_saved = newsapi_ai_future.result()
+                total_saved += newsapi_ai_saved
+                logger.info(f"Saved {newsapi_ai_saved} articles from NewsAPI.ai")
+            except Exception as e:
+                logger.error(f"Failed to fetch from NewsAPI.ai: {e}")
         
         logger.info(f"Total articles saved to database: {total_saved}")
         return total_saved
 
+    def _fetch_with_own_session(self, fetch, start_time: datetime, end_time: datetime) -> int:
+        """Run a fetcher against a dedicated database session, closing it afterwards"""
+        db_session = get_db_session()
+        try:
+            return fetch(start_time, end_time, db_session)
+        finally:
+            db_session.close()
+
     def run_realtime_aggregation(self):
         """Main method to run the realtime news aggregation"""
         logger.info("Starting realtime news aggregation...")
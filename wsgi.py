@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers, e.g. `gunicorn wsgi:application`
+
+Runs the same start-up initialization as `python app.py` (which uses Flask's
+development server) before handing the app to the server.
+"""
+from app import app, initialize_app
+
+initialize_app()
+
+application = app